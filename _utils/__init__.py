@@ -1,3 +1,4 @@
+import _utils.latency as latency
 import _utils.math as math
 import _utils.time as time
 import _utils.typing as typing
@@ -0,0 +1,119 @@
+import numpy as np
+
+from _utils.val import defval_instance
+
+
+class LatencyHistogram:
+    """
+    Fixed memory histogram of nanosecond latencies with HDR-style log buckets.
+
+    Values below 2**sub_bits are counted exactly. Above that, every power of two is split into 2**(sub_bits - 1)
+    linear buckets, so the relative error is at most 2**-(sub_bits - 1) (about 3% for the default of 6 bits).
+    Values above 2**max_bits are clamped.
+    """
+
+    def __init__(self, sub_bits: int = None, max_bits: int = None) -> None:
+        """
+        Args:
+            sub_bits (int, optional): Precision in bits. Defaults to 6.
+            max_bits (int, optional): Largest recordable value in bits. Defaults to 40 (about 18 minutes).
+        """
+
+        self.sub_bits = defval_instance(sub_bits, int, 6)
+        self.max_bits = defval_instance(max_bits, int, 40)
+
+        self._half = 1 << (self.sub_bits - 1)
+        self._max = (1 << self.max_bits) - 1
+
+        self.counts = [0] * self._index(self._max) + [0]
+        self.count = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self.sub_bits
+
+        if shift <= 0:
+            return value
+
+        return shift * self._half + (value >> shift)
+
+    def _value(self, index: int) -> int:
+        # midpoint of the bucket
+        if index < 2 * self._half:
+            return index
+
+        shift = index // self._half - 1
+        bucket = index - shift * self._half
+
+        return (bucket << shift) + (1 << (shift - 1))
+
+    def record(self, value: int) -> None:
+        """
+        Records a latency in nanoseconds.
+        """
+
+        if value < 0:
+            return
+
+        if value > self._max:
+            value = self._max
+
+        self.counts[self._index(value)] += 1
+        self.count += 1
+
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Returns the latency at the percentile, in nanoseconds.
+
+        Args:
+            percentile (float): Percentile between 0 and 100.
+
+        Returns:
+            int: Latency, 0 if nothing was recorded.
+        """
+
+        if self.count == 0:
+            return 0
+
+        cumulative = np.cumsum(self.counts)
+        rank = max(1, int(np.ceil(percentile / 100 * self.count)))
+
+        return min(self._value(int(np.searchsorted(cumulative, rank))), self.max)
+
+    def summary(self) -> dict:
+        """
+        Returns the count, p50, p99, p999 and max in microseconds.
+        """
+
+        return {
+            "count": self.count,
+            "p50_us": self.percentile(50) / 1_000,
+            "p99_us": self.percentile(99) / 1_000,
+            "p999_us": self.percentile(99.9) / 1_000,
+            "max_us": self.max / 1_000,
+        }
+
+
+class LatencyRecorder:
+    """
+    A LatencyHistogram per tag, created on first use.
+    """
+
+    def __init__(self, sub_bits: int = None, max_bits: int = None) -> None:
+        self.sub_bits = sub_bits
+        self.max_bits = max_bits
+        self.histograms: dict[str, LatencyHistogram] = {}
+
+    def record(self, tag: str, value: int) -> None:
+        histogram = self.histograms.get(tag)
+
+        if histogram is None:
+            histogram = self.histograms[tag] = LatencyHistogram(self.sub_bits, self.max_bits)
+
+        histogram.record(value)
+
+    def summary(self) -> dict[str, dict]:
+        return {tag: histogram.summary() for tag, histogram in sorted(self.histograms.items())}
@@ -1,8 +1,11 @@
 from dateutil.parser._parser import parse as parse_timestr
 from datetime import date, datetime, time, timedelta
 import datetime as dt
+from functools import lru_cache
 from time import strftime
+from types import NoneType
 from numpy import isin
+import numpy as np
 import pytz
 import pandas_market_calendars as mcal
 from typing import Iterable, Iterator, Type
@@ -13,6 +16,9 @@ from dateutil.zoneinfo import tzfile
 
 from _utils.val import val_instance
 
+NS_PER_SECOND: int = 1_000_000_000
+NS_PER_DAY: int = 86_400 * NS_PER_SECOND
+
 def is_dst(dt: datetime = None, timezone: str = "UTC") -> bool:
     """
     Returns true if it is daylight savings time, else it returns false.
@@ -157,11 +163,83 @@ def parse_time(_time: str, format: str = None, infer_time_format: bool = False,
     Returns
     -------
     datetime.time
+
+    Single strings are memoized, so repeatedly parsing the same bounds is free.
     """
     
+    if isinstance(_time, str):
+        return _parse_time_str(_time, format, infer_time_format, errors)
+    
+    return to_time(_time, format, infer_time_format, errors)
+
+
+@lru_cache(maxsize=1024)
+def _parse_time_str(_time: str, format: str, infer_time_format: bool, errors: str) -> time:
     return to_time(_time, format, infer_time_format, errors)
 
 
+def time_to_ns(_time: time) -> int:
+    """
+    Returns the nanoseconds since midnight of a time.
+
+    Args:
+        _time (time): The time.
+
+    Returns:
+        int: Nanoseconds since midnight.
+    """
+    
+    return ((_time.hour * 60 + _time.minute) * 60 + _time.second) * NS_PER_SECOND + _time.microsecond * 1_000
+
+
+def _to_time_ns(_time: datetime | time | float | str, name: str) -> int:
+    if isinstance(_time, datetime):
+        return time_to_ns(_time.time())
+    elif isinstance(_time, time):
+        return time_to_ns(_time)
+    elif isinstance(_time, float):
+        return time_to_ns(datetime.fromtimestamp(_time).time())
+    elif isinstance(_time, str):
+        return time_to_ns(parse_time(_time))
+    
+    raise TypeError(
+        f"Expect datetime, time, float, or str object for '{name}', got {type(_time)}.")
+
+
+def _in_bounds(_time_ns: int | np.ndarray, _from_ns: int | None, _to_ns: int | None) -> bool | np.ndarray:
+    # bounds are inclusive, a range with _to before _from wraps around midnight
+    if _from_ns is None:
+        return _time_ns <= _to_ns
+    elif _to_ns is None:
+        return _time_ns >= _from_ns
+    elif _to_ns < _from_ns:
+        return (_time_ns >= _from_ns) | (_time_ns <= _to_ns)
+    else:
+        return (_time_ns >= _from_ns) & (_time_ns <= _to_ns)
+
+
+def times_to_ns(_times: np.ndarray) -> np.ndarray:
+    """
+    Returns the nanoseconds since midnight of an array of naive datetime64 values, or of int64 nanoseconds since the epoch.
+
+    Args:
+        _times (np.ndarray): datetime64 (any unit) or int64 array.
+
+    Returns:
+        np.ndarray: int64 nanoseconds since midnight.
+    """
+    
+    _times = np.asarray(_times)
+    
+    if np.issubdtype(_times.dtype, np.datetime64):
+        _times = _times.astype("datetime64[ns]").view("int64")
+    elif not np.issubdtype(_times.dtype, np.integer):
+        raise TypeError(
+            f"Expect a datetime64 or int64 array for '_times', got {_times.dtype}.")
+    
+    return _times % NS_PER_DAY
+
+
 def time_in_range(_time: datetime | time | float | str, _from: time | str = None, _to: time | str = None) -> bool:
     """
     Returns True if the time is between _from and _to.
@@ -172,61 +250,30 @@ def time_in_range(_time: datetime | time | float | str, _from: time | str = None
         _to (time | str, optional): The to time. If not passed it is only checked if _time is after _from.
 
         _time, _from, and _to: can be in str format: 'HH:MM:SS'.
+        If _to is before _from the range wraps around midnight.
 
     Returns:
         bool: True if time is between passed parameters, False otherwise.
     """
 
-    if isinstance(_time, datetime):
-        __time = _time.time()
-    elif isinstance(_time, time):
-        __time = _time
-    elif isinstance(_time, float):
-        __time = datetime.fromtimestamp(_time).time()
-    elif isinstance(_time, str):
-        __time = parse_time(_time)
-    else:
-        raise TypeError(
-            f"Expect datetime, time, or float object for '_time', got {type(_time)}.")
-
-    if not _from is None:
-        if isinstance(_from, time):
-            _from = _from
-        elif isinstance(_from, str):
-            _from = parse_time(_from)
-        else:
-            raise TypeError(
-                f"Expect time or str object for '_from', got {type(_from)}.")
-
-    if not _to is None:
-        if isinstance(_to, time):
-            _to = _to
-        elif isinstance(_to, str):
-            _to = parse_time(_to)
-        else:
-            raise TypeError(
-                f"Expect time or str object for '_to', got {type(_to)}.")
+    __time = _to_time_ns(_time, "_time")
+    _from = None if _from is None else _to_time_ns(_from, "_from")
+    _to = None if _to is None else _to_time_ns(_to, "_to")
 
     if _from is None and _to is None:
         raise ValueError("'_from' and '_to' can't both be None. If '_from' is None method checks if the time is after '_from'. If '_to' is None method checks if time is before '_to'. But only one or the other can be None.")
 
-    if _from is None:
-        if __time <= _to:
-            in_range = True
-        else:
-            in_range = False
-    elif _to is None:
-        if __time >= _from:
-            in_range = True
-        else:
-            in_range = False
-    else:
-        if _to < _from:
-            in_range = __time >= _to and __time <= _from
-        else:
-            in_range = __time <= _to and __time >= _from
+    return bool(_in_bounds(__time, _from, _to))
+
+
+def _to_datetime(_date: datetime | float, name: str) -> datetime:
+    if isinstance(_date, datetime):
+        return _date
+    elif isinstance(_date, float):
+        return datetime.fromtimestamp(_date)
 
-    return in_range
+    raise TypeError(
+        f"Expect datetime, or float object for '{name}', got {type(_date)}.")
 
 
 def date_in_range(_date: datetime | float, _from: datetime | float = None, _to: datetime | float = None) -> bool:
@@ -242,52 +289,73 @@ def date_in_range(_date: datetime | float, _from: datetime | float = None, _to:
         bool: True if the datetime is between passed parameters, False otherwise.
     """
 
-    if isinstance(_date, datetime):
-        _date = _date
-    elif isinstance(_date, float):
-        _date = datetime.fromtimestamp(_date).time()
-    else:
-        raise TypeError(
-            f"Expect datetime, or float object for '_time', got {type(_date)}.")
-
-    if isinstance(_from, datetime):
-        _from = _from
-    elif isinstance(_from, float):
-        _from = datetime.fromtimestamp(_from).time()
-    elif not _from is None:
-        raise TypeError(
-            f"Expect datetime object for '_from', got {type(_from)}.")
-
-    if isinstance(_to, datetime):
-        _to = _to
-    elif isinstance(_to, float):
-        _to = datetime.fromtimestamp(_to).time()
-    elif not _from is None:
-        raise TypeError(f"Expect datetime object for '_to', got {type(_to)}.")
+    _date = _to_datetime(_date, "_date")
+    _from = None if _from is None else _to_datetime(_from, "_from")
+    _to = None if _to is None else _to_datetime(_to, "_to")
 
     if _from is None and _to is None:
         raise ValueError("'_from' and '_to' can't both be None. If '_from' is None method checks if the date is after '_from'. If _to is None method checks if date is before '_to'. But only one or the other can be None.")
 
     if _from is None:
-        if _date <= _to:
-            in_range = True
-        else:
-            in_range = False
+        return _date <= _to
     elif _to is None:
-        if _date >= _from:
-            in_range = True
-        else:
-            in_range = False
+        return _date >= _from
+    elif _to < _from:
+        return _date >= _to and _date <= _from
     else:
-        if _to < _from:
-            in_range = _date >= _to and _date <= _from
-        else:
-            in_range = _date <= _to and _date >= _from
+        return _date <= _to and _date >= _from
+
+
+def dates_in_range(_dates: np.ndarray, _from: datetime | float = None, _to: datetime | float = None) -> np.ndarray:
+    """
+    Vectorized date_in_range over an array of dates.
+
+    Bounds are compiled once and compared on naive wall clock time, timezone aware bounds have their timezone dropped.
+
+    Args:
+        _dates (np.ndarray): datetime64 (any unit) or int64 nanoseconds since the epoch.
+        _from (datetime | float, optional): The from date and time.
+        _to (datetime | float, optional): The to date and time.
+
+    Returns:
+        np.ndarray: Boolean mask of the dates in range.
+    """
+
+    _dates = np.asarray(_dates)
+
+    if np.issubdtype(_dates.dtype, np.datetime64):
+        _dates = _dates.astype("datetime64[ns]").view("int64")
+    elif not np.issubdtype(_dates.dtype, np.integer):
+        raise TypeError(
+            f"Expect a datetime64 or int64 array for '_dates', got {_dates.dtype}.")
+
+    def compile(_date: datetime | float | None, name: str) -> int | None:
+        if _date is None:
+            return None
+
+        _date = _to_datetime(_date, name).replace(tzinfo=None)
 
-    return in_range
+        return int(np.datetime64(_date, "ns").astype("int64"))
+
+    _from = compile(_from, "_from")
+    _to = compile(_to, "_to")
+
+    if _from is None and _to is None:
+        raise ValueError("'_from' and '_to' can't both be None.")
+
+    if _from is not None and _to is not None and _to < _from:
+        _from, _to = _to, _from
+
+    return _in_bounds(_dates, _from, _to)
 
 
 class TimeRange:
+    """
+    A range of the day, from start to end inclusive. A range with end before start wraps around midnight.
+
+    The bounds are compiled to nanoseconds since midnight when set, so membership checks are integer comparisons.
+    """
+
     def __init__(self, start: dt.datetime | dt.time | str = None, end: dt.datetime | dt.time | str = None) -> None:
         self.start = None
         self.end = None
@@ -295,8 +363,8 @@ class TimeRange:
         self.adjust(start=start, end=end)
 
     def adjust(self, start: dt.datetime | dt.time | str = None, end: dt.datetime | dt.time | str = None) -> None:
-        val_instance(start, (dt.datetime, dt.time, str))
-        val_instance(end, (dt.datetime, dt.time, str))
+        val_instance(start, (dt.datetime, dt.time, str, NoneType))
+        val_instance(end, (dt.datetime, dt.time, str, NoneType))
         
         if not start is None:
             if isinstance(start, dt.datetime):
@@ -322,11 +390,28 @@ class TimeRange:
         else:
             self.end = dt.time(23, 59, 59)
 
-    def __contains__(self, _time: time) -> bool:
-        if self.start is None and self.end is None:
-            raise ValueError(f"Both start and end can't be None.")
+        self.start_ns = time_to_ns(self.start)
+        self.end_ns = time_to_ns(self.end)
+
+    @property
+    def wraps(self) -> bool:
+        return self.end_ns < self.start_ns
+
+    def __contains__(self, _time: datetime | time | float | str) -> bool:
+        return bool(_in_bounds(_to_time_ns(_time, "_time"), self.start_ns, self.end_ns))
+
+    def contains_many(self, _times: np.ndarray) -> np.ndarray:
+        """
+        Vectorized membership check.
+
+        Args:
+            _times (np.ndarray): Naive datetime64 (any unit) or int64 nanoseconds since the epoch.
+
+        Returns:
+            np.ndarray: Boolean mask of the times in range.
+        """
 
-        return time_in_range(_time, self.start, self.end)
+        return _in_bounds(times_to_ns(_times), self.start_ns, self.end_ns)
     
     def __str__(self) -> str:
         return f"{self.start.strftime('%H:%M:%S')} - {self.end.strftime('%H:%M:%S')}"
\ No newline at end of file
@@ -0,0 +1,3 @@
+from analysis.events import Archive, EventLog, TRANSITIONS, archive, encode, histogram, pair, time_to_move, transition_stats
+from analysis.leadlag import cross_correlation, lead_lag, returns, rolling_beta, rolling_corr
+from analysis.portfolio import Trades, daily, from_results, from_rviews, max_drawdown, summary
\ No newline at end of file
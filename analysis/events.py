@@ -0,0 +1,261 @@
+from collections import namedtuple
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from strategies.strategy import StrategyEvent
+from ticks.resample import ffill
+from ticks.rview import load, wall_ns
+from ticks.schema import TickFrame
+from _utils.math import bps
+from _utils.time import NS_PER_DAY, NS_PER_SECOND
+from _utils.typing import PathLike
+from _utils.val import val_instance
+
+EVENT_NAMES: list[str] = [
+    "stock cliff",
+    "stock cliff corrected",
+    "verification part 1",
+    "verification done",
+    "verification reset",
+    "signal 1",
+    "signal 2",
+]
+EVENT_CODES: dict[str, int] = {name: code for code, name in enumerate(EVENT_NAMES)}
+UNKNOWN: int = -1
+SUPERSEDED: int = -2
+
+Transition = namedtuple("Transition", ["start", "ends"])
+
+TRANSITIONS: dict[str, Transition] = {
+    "cliff": Transition("stock cliff", ("stock cliff corrected",)),
+    "verification": Transition("verification part 1", ("verification done", "verification reset")),
+    "signal": Transition("signal 1", ("signal 2",)),
+}
+
+# time: sorted int64 nanoseconds of naive wall clock times, code: index into EVENT_NAMES or UNKNOWN
+EventLog = namedtuple("EventLog", ["time", "code"])
+
+# time: sorted int64 nanoseconds of naive wall clock times, index/stock: forward filled prices
+Archive = namedtuple("Archive", ["events", "time", "index", "stock"])
+
+# start/end: int64 nanoseconds, outcome: code of the end event, UNKNOWN or SUPERSEDED, latency: seconds or NaN when unresolved
+Pairs = namedtuple("Pairs", ["start", "end", "outcome", "latency"])
+
+
+def encode(days: Iterable[list[StrategyEvent]]) -> EventLog:
+    """
+    Encodes the events of many days into sorted time and code arrays.
+
+    Args:
+        days (Iterable[list[StrategyEvent]]): Event lists, typically one per day.
+
+    Returns:
+        EventLog: The encoded events.
+    """
+
+    events = [event for day in days for event in day]
+
+    if len(events) == 0:
+        return EventLog(np.array([], dtype="int64"), np.array([], dtype="int8"))
+
+    time = wall_ns([event.time for event in events])
+    code = np.array([EVENT_CODES.get(event.name, UNKNOWN) for event in events], dtype="int8")
+
+    order = np.argsort(time, kind="stable")
+
+    return EventLog(time[order], code[order])
+
+
+def archive(paths: Iterable[PathLike]) -> Archive:
+    """
+    Loads the events and ticks of many *.rview files.
+
+    Args:
+        paths (Iterable[PathLike]): Paths to the *.rview files.
+
+    Returns:
+        Archive: The encoded events and the sorted, forward filled ticks of every file.
+    """
+
+    days = []
+    times, indices, stocks = [], [], []
+
+    for path in paths:
+        data, events, _ = load(path)
+        days.append(events)
+
+        # legacy rows or a TickFrame
+        frame = TickFrame.from_data(data)
+
+        if len(frame) == 0:
+            continue
+
+        times.append(frame.time)
+        indices.append(frame.column("INDEX"))
+        stocks.append(frame.column("STOCK"))
+
+    if len(times) == 0:
+        empty = np.array([], dtype=float)
+        return Archive(encode(days), np.array([], dtype="int64"), empty, empty)
+
+    time = np.concatenate(times)
+    order = np.argsort(time, kind="stable")
+
+    prices = ffill(np.column_stack([np.concatenate(indices), np.concatenate(stocks)])[order])
+
+    return Archive(encode(days), time[order], prices[:, 0], prices[:, 1])
+
+
+def pair(log: EventLog, transition: Transition) -> Pairs:
+    """
+    Pairs start and end events of a transition one to one, in sequence: a start resolves to the event right after it
+    among the transition's events if that is an end on the same day. A start followed by another start is superseded,
+    a start followed by nothing (or by the next day) is unresolved.
+
+    Args:
+        log (EventLog): Encoded events.
+        transition (Transition): Transition to pair.
+
+    Returns:
+        Pairs: One entry per start event.
+    """
+    val_instance(log, EventLog)
+    val_instance(transition, Transition)
+
+    start_code = EVENT_CODES[transition.start]
+
+    # the log is sorted, so the transition's own events are too
+    relevant = np.isin(log.code, [start_code] + [EVENT_CODES[name] for name in transition.ends])
+    time, code = log.time[relevant], log.code[relevant]
+
+    starts = np.flatnonzero(code == start_code)
+    start = time[starts]
+
+    if len(starts) == 0:
+        return Pairs(start, np.array([], dtype="int64"), np.array([], dtype="int8"), np.array([], dtype=float))
+
+    following = np.minimum(starts + 1, len(time) - 1)
+    same_day = (starts + 1 < len(time)) & ((time[following] // NS_PER_DAY) == (start // NS_PER_DAY))
+
+    resolved = same_day & (code[following] != start_code)
+    superseded = same_day & ~resolved
+
+    end = np.where(resolved, time[following], -1)
+    outcome = np.select([resolved, superseded], [code[following], SUPERSEDED], UNKNOWN).astype("int8")
+    latency = np.where(resolved, (time[following] - start) / NS_PER_SECOND, np.nan)
+
+    return Pairs(start, end, outcome, latency)
+
+
+def transition_stats(log: EventLog) -> pd.DataFrame:
+    """
+    Summarizes every transition in TRANSITIONS: how often it starts, how it resolves and how long it takes, and how
+    many of its end events had no start to resolve.
+
+    Args:
+        log (EventLog): Encoded events.
+
+    Returns:
+        pd.DataFrame: One row per transition and outcome.
+    """
+
+    rows = []
+
+    for name, transition in TRANSITIONS.items():
+        pairs = pair(log, transition)
+        count = len(pairs.start)
+
+        for end in transition.ends + ("superseded", None):
+            code = UNKNOWN if end is None else SUPERSEDED if end == "superseded" else EVENT_CODES[end]
+            latency = pairs.latency[pairs.outcome == code]
+            n = int((pairs.outcome == code).sum())
+
+            rows.append({
+                "transition": name,
+                "outcome": "unresolved" if end is None else end,
+                "count": n,
+                "rate": n / count if count else np.nan,
+                # end events no start resolved to, pairing being one to one
+                "unpaired": int((log.code == code).sum()) - n if code >= 0 else np.nan,
+                "latency_mean": np.mean(latency) if n and code >= 0 else np.nan,
+                "latency_p50": np.median(latency) if n and code >= 0 else np.nan,
+                "latency_p90": np.percentile(latency, 90) if n and code >= 0 else np.nan,
+                "latency_max": np.max(latency) if n and code >= 0 else np.nan,
+            })
+
+    return pd.DataFrame(rows)
+
+
+def time_to_move(archive: Archive, name: str, threshold_bps: float, horizon: int = 600, series: str = "stock") -> np.ndarray:
+    """
+    Returns, for every event with the given name, the seconds until the price first moves threshold_bps away from
+    its price at the event.
+
+    Every event looks at the next horizon ticks at once, so the cost is O(events * horizon) in vectorized operations.
+
+    Args:
+        archive (Archive): Events and ticks.
+        name (str): Event name.
+        threshold_bps (float): Size of the move in basis points.
+        horizon (int, optional): Maximum number of ticks to look ahead. Defaults to 600.
+        series (str, optional): "stock" or "index". Defaults to "stock".
+
+    Returns:
+        np.ndarray: Seconds to the move, NaN if it didn't happen within the horizon on the same day.
+    """
+    val_instance(archive, Archive)
+    val_instance(name, str)
+
+    if series not in ("stock", "index"):
+        raise ValueError(f"Expected 'stock' or 'index' for 'series', got '{series}'.")
+
+    event_time = archive.events.time[archive.events.code == EVENT_CODES[name]]
+    price = getattr(archive, series)
+
+    if len(event_time) == 0 or len(archive.time) == 0:
+        return np.full(len(event_time), np.nan)
+
+    i = np.searchsorted(archive.time, event_time, side="right") - 1
+    reference = np.where(i >= 0, price[np.maximum(i, 0)], np.nan)
+
+    padded_price = np.append(price, np.full(horizon, np.nan))
+    padded_time = np.append(archive.time, np.full(horizon, np.iinfo("int64").max))
+
+    windows = np.lib.stride_tricks.sliding_window_view(padded_price, horizon)[i + 1]
+
+    with np.errstate(invalid="ignore"):
+        moved = np.abs(windows / reference[:, None] - 1) >= bps(threshold_bps)
+
+    first = moved.argmax(axis=1)
+    move_time = padded_time[i + 1 + first]
+
+    hit = moved.any(axis=1) & ((move_time // NS_PER_DAY) == (event_time // NS_PER_DAY))
+
+    return np.where(hit, (move_time - event_time) / NS_PER_SECOND, np.nan)
+
+
+def histogram(values: np.ndarray, bins: int | np.ndarray = 20) -> pd.DataFrame:
+    """
+    Returns a histogram table of values, ignoring NaNs.
+
+    Args:
+        values (np.ndarray): Values.
+        bins (int | np.ndarray, optional): Number of bins or bin edges. Defaults to 20.
+
+    Returns:
+        pd.DataFrame: Columns from, to, count and share.
+    """
+
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+
+    count, edges = np.histogram(values, bins=bins)
+
+    return pd.DataFrame({
+        "from": edges[:-1],
+        "to": edges[1:],
+        "count": count,
+        "share": count / len(values) if len(values) else np.zeros(len(count)),
+    })
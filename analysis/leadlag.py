@@ -0,0 +1,153 @@
+import numpy as np
+
+from ticks.resample import resample
+
+
+def returns(time: np.ndarray, prices: np.ndarray, freq: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the log returns of prices resampled on a uniform grid.
+
+    Args:
+        time (np.ndarray): Sorted tick times.
+        prices (np.ndarray): Tick prices, 1-d or 2-d along the first axis.
+        freq (str): Grid frequency. eg. "1s", "5s", "1m".
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The grid (without its first point) and the returns ending at each grid point.
+    """
+
+    grid, sampled = resample(time, prices, freq)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return grid[1:], np.diff(np.log(sampled), axis=0)
+
+
+def _rolling_sum(a: np.ndarray, window: int) -> np.ndarray:
+    cumsum = np.concatenate([[0.0], np.cumsum(a)])
+    out = np.full(len(a), np.nan)
+    out[window - 1:] = cumsum[window:] - cumsum[:-window]
+
+    return out
+
+
+def _rolling_moments(x: np.ndarray, y: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # pairs with a NaN on either side are left out, windows with fewer than 2 pairs are NaN
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x, y = np.where(valid, x, 0.0), np.where(valid, y, 0.0)
+
+    n = _rolling_sum(valid.astype(float), window)
+    n = np.where(n >= 2, n, np.nan)
+
+    mean_x = _rolling_sum(x, window) / n
+    mean_y = _rolling_sum(y, window) / n
+
+    cov = _rolling_sum(x * y, window) / n - mean_x * mean_y
+    var_x = _rolling_sum(x * x, window) / n - mean_x ** 2
+    var_y = _rolling_sum(y * y, window) / n - mean_y ** 2
+
+    return cov, var_x, var_y, n
+
+
+def rolling_corr(x: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling Pearson correlation of x and y over the trailing window, from cumulative sums in O(n).
+
+    Args:
+        x (np.ndarray): First series.
+        y (np.ndarray): Second series.
+        window (int): Window length in samples.
+
+    Returns:
+        np.ndarray: Correlation ending at every sample, NaN until the window is full.
+    """
+
+    cov, var_x, var_y, _ = _rolling_moments(np.asarray(x, dtype=float), np.asarray(y, dtype=float), window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return cov / np.sqrt(var_x * var_y)
+
+
+def rolling_beta(x: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling beta of y on x over the trailing window, from cumulative sums in O(n).
+
+    Args:
+        x (np.ndarray): Explanatory series. eg. index returns.
+        y (np.ndarray): Dependent series. eg. stock returns.
+        window (int): Window length in samples.
+
+    Returns:
+        np.ndarray: Beta ending at every sample, NaN until the window is full.
+    """
+
+    cov, var_x, _, _ = _rolling_moments(np.asarray(x, dtype=float), np.asarray(y, dtype=float), window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return cov / var_x
+
+
+def cross_correlation(x: np.ndarray, y: np.ndarray, max_lag: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cross-correlation of x[t] with y[t + lag] for every lag in [-max_lag, max_lag], computed for all lags at once
+    with an FFT in O(n log n). A peak at a positive lag means x leads y.
+
+    NaNs are treated as zero returns.
+
+    Args:
+        x (np.ndarray): First series.
+        y (np.ndarray): Second series, same length as x.
+        max_lag (int): Largest lag in samples.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The lags and the correlation at each lag.
+    """
+
+    x = np.nan_to_num(np.asarray(x, dtype=float))
+    y = np.nan_to_num(np.asarray(y, dtype=float))
+
+    if len(x) != len(y):
+        raise ValueError(
+            f"sample size of 'x' and sample size of 'y' must be the same.")
+
+    n = len(x)
+    max_lag = min(max_lag, n - 1)
+    lags = np.arange(-max_lag, max_lag + 1)
+
+    if n < 2:
+        return lags, np.full(len(lags), np.nan)
+
+    x = x - x.mean()
+    y = y - y.mean()
+
+    size = 1 << int(2 * n - 1).bit_length()
+    cc = np.fft.irfft(np.conj(np.fft.rfft(x, size)) * np.fft.rfft(y, size), size)
+
+    # negative lags wrap around to the end
+    cc = np.concatenate([cc[size - max_lag:], cc[:max_lag + 1]])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return lags, cc / (n - np.abs(lags)) / (x.std() * y.std())
+
+
+def lead_lag(x: np.ndarray, y: np.ndarray, max_lag: int) -> tuple[int, float]:
+    """
+    Returns the lag with the strongest cross-correlation between x and y.
+
+    Args:
+        x (np.ndarray): First series.
+        y (np.ndarray): Second series, same length as x.
+        max_lag (int): Largest lag in samples.
+
+    Returns:
+        tuple[int, float]: The lag (positive if x leads y) and its correlation.
+    """
+
+    lags, corr = cross_correlation(x, y, max_lag)
+
+    if np.all(np.isnan(corr)):
+        return 0, np.nan
+
+    i = np.nanargmax(np.abs(corr))
+
+    return int(lags[i]), float(corr[i])
+
@@ -0,0 +1,200 @@
+from collections import namedtuple
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from strategies.strategy import StrategyResults
+from ticks.rview import load
+from _utils.typing import PathLike
+
+# date: datetime64[D], bps: P&L in basis points (0 without a trade), traded: bool, holding: seconds or NaN
+Trades = namedtuple("Trades", ["date", "bps", "traded", "holding"])
+
+Drawdown = namedtuple("Drawdown", ["depth", "peak", "trough", "duration"])
+
+
+def from_results(results: Iterable[StrategyResults | list[StrategyResults]]) -> Trades:
+    """
+    Collects results into arrays sorted by date. Each StrategyResults is one day (or one trade of a day).
+
+    Args:
+        results (Iterable[StrategyResults | list[StrategyResults]]): Results, or lists of results as stored in *.rview files.
+
+    Returns:
+        Trades: The trades.
+    """
+
+    results = [r for item in results for r in (item if isinstance(item, list) else [item])]
+
+    def day(r: StrategyResults):
+        if r.date is not None:
+            return r.date
+        return None if r.buy_time is None else r.buy_time.date()
+
+    date = np.array([day(r) for r in results], dtype="datetime64[D]")
+    buy_price = np.array([r.buy_price for r in results], dtype=float)
+    sell_price = np.array([r.sell_price for r in results], dtype=float)
+
+    # utc so that fixed offset timestamps of different days subtract correctly
+    buy_time = pd.to_datetime([r.buy_time for r in results], utc=True)
+    sell_time = pd.to_datetime([r.sell_time for r in results], utc=True)
+
+    traded = ~(np.isnan(buy_price) | np.isnan(sell_price))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bps = np.where(traded, (sell_price - buy_price) / buy_price * 10_000, 0.0)
+
+    holding = np.asarray((sell_time - buy_time).total_seconds(), dtype=float)
+
+    order = np.argsort(date, kind="stable")
+
+    return Trades(date[order], bps[order], traded[order], holding[order])
+
+
+def from_rviews(paths: Iterable[PathLike]) -> Trades:
+    """
+    Collects the results of many *.rview files.
+
+    Args:
+        paths (Iterable[PathLike]): Paths to the *.rview files.
+
+    Returns:
+        Trades: The trades.
+    """
+
+    return from_results(load(path)[2] for path in paths)
+
+
+def daily(trades: Trades) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sums the P&L of the trades per day, the period the curve and ratio figures are computed over.
+
+    Args:
+        trades (Trades): The trades, sorted by date.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The distinct dates (datetime64[D]) and their P&L in basis points.
+    """
+
+    if len(trades.date) == 0:
+        return trades.date, trades.bps
+
+    date, first = np.unique(trades.date, return_index=True)
+
+    return date, np.add.reduceat(trades.bps, first)
+
+
+def equity_curve(bps: np.ndarray) -> np.ndarray:
+    """
+    Cumulative P&L in basis points.
+    """
+
+    return np.cumsum(bps)
+
+
+def drawdown(equity: np.ndarray) -> np.ndarray:
+    """
+    Distance below the running high of the equity curve, zero or negative. The curve starts from 0, so losses from
+    the start count as drawdown.
+    """
+
+    return equity - np.maximum(np.maximum.accumulate(equity), 0)
+
+
+def max_drawdown(equity: np.ndarray) -> Drawdown:
+    """
+    Returns the deepest drawdown of the equity curve.
+
+    Args:
+        equity (np.ndarray): Equity curve.
+
+    Returns:
+        Drawdown: Its depth (negative), the indices of its peak and trough, and its duration in periods from the
+        peak until the curve recovered to the peak, or until the last period if it never did. The peak is -1 when it
+        is the starting equity of 0, before the first period.
+    """
+
+    if len(equity) == 0:
+        return Drawdown(0.0, 0, 0, 0)
+
+    # index 0 is the starting equity, everything below is shifted back by one
+    equity = np.concatenate([[0.0], equity])
+
+    dd = equity - np.maximum.accumulate(equity)
+    trough = int(np.argmin(dd))
+    peak = int(np.argmax(equity[:trough + 1]))
+
+    recovered = np.flatnonzero(equity[trough:] >= equity[peak])
+    end = trough + int(recovered[0]) if len(recovered) else len(equity) - 1
+
+    return Drawdown(float(dd[trough]), peak - 1, trough - 1, end - peak)
+
+
+def hit_rate(trades: Trades) -> float:
+    """
+    Share of traded days with a positive P&L.
+    """
+
+    traded = trades.bps[trades.traded]
+
+    return float(np.mean(traded > 0)) if len(traded) else np.nan
+
+
+def sharpe(bps: np.ndarray, periods: int = 252) -> float:
+    """
+    Annualized Sharpe ratio of daily basis point returns.
+    """
+
+    if len(bps) < 2:
+        return np.nan
+
+    std = np.std(bps, ddof=1)
+
+    return float(np.mean(bps) / std * np.sqrt(periods)) if std > 0 else np.nan
+
+
+def sortino(bps: np.ndarray, periods: int = 252) -> float:
+    """
+    Annualized Sortino ratio of daily basis point returns.
+    """
+
+    if len(bps) < 2:
+        return np.nan
+
+    downside = np.sqrt(np.mean(np.minimum(bps, 0) ** 2))
+
+    return float(np.mean(bps) / downside * np.sqrt(periods)) if downside > 0 else np.nan
+
+
+def summary(trades: Trades) -> dict:
+    """
+    Returns the headline figures of the trades.
+
+    Args:
+        trades (Trades): The trades.
+
+    Returns:
+        dict: Days, trades, total bps, hit rate, Sharpe, Sortino, max drawdown and holding time figures. The
+        curve and ratio figures are over daily P&L, the hit rate and holding times over trades.
+    """
+
+    _, bps = daily(trades)
+
+    equity = equity_curve(bps)
+    dd = max_drawdown(equity)
+    holding = trades.holding[trades.traded]
+
+    return {
+        "days": len(bps),
+        "trades": int(trades.traded.sum()),
+        "total_bps": float(equity[-1]) if len(equity) else 0.0,
+        "mean_bps": float(np.mean(trades.bps[trades.traded])) if trades.traded.any() else np.nan,
+        "hit_rate": hit_rate(trades),
+        "sharpe": sharpe(bps),
+        "sortino": sortino(bps),
+        "max_drawdown_bps": dd.depth,
+        "max_drawdown_days": dd.duration,
+        "holding_median_s": float(np.nanmedian(holding)) if len(holding) else np.nan,
+        "holding_p90_s": float(np.nanpercentile(holding, 90)) if len(holding) else np.nan,
+    }
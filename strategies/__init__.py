@@ -1 +1,2 @@
-from strategies.strategy import Strategy, Config
\ No newline at end of file
+from strategies.strategy import Strategy, Config
+from strategies.signals import SignalConfig, detect, diff
\ No newline at end of file
@@ -0,0 +1,307 @@
+import datetime as dt
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from strategies.strategy import Config, StrategyEvent
+from ticks.resample import ffill, to_ns
+from ticks.rview import wall_ns
+from _utils.math import bps
+from _utils.time import NS_PER_DAY
+from _utils.val import defval_instance, val_instance
+
+
+class SignalConfig(Config):
+    """
+    Thresholds of the offline signal detector. Windows are in ticks.
+    """
+
+    FIELDS = ("cliff_bps", "cliff_window", "correction_bps", "verification_bps", "verification_window", "take_profit_bps", "stop_loss_bps", "max_hold")
+    INT_FIELDS = ("cliff_window", "verification_window", "max_hold")
+
+    def __init__(self, cliff_bps: float = None, cliff_window: int = None, correction_bps: float = None, verification_bps: float = None,
+                 verification_window: int = None, take_profit_bps: float = None, stop_loss_bps: float = None, max_hold: int = None) -> None:
+        """
+        Args:
+            cliff_bps (float, optional): Drop of the stock from its rolling high that counts as a cliff. Defaults to 10.
+            cliff_window (int, optional): Length of the rolling high. Defaults to 60.
+            correction_bps (float, optional): How far below the pre-cliff high the stock must recover to for the cliff to be corrected. Defaults to 2.
+            verification_bps (float, optional): Largest drop of the index over the verification window that still verifies. Defaults to 5.
+            verification_window (int, optional): Ticks the stock must hold the corrected level for. Defaults to 20.
+            take_profit_bps (float, optional): Gain at which the position is sold. Defaults to 20.
+            stop_loss_bps (float, optional): Loss at which the position is sold. Defaults to 10.
+            max_hold (int, optional): Ticks after which the position is sold regardless. Defaults to 600.
+        """
+
+        self.cliff_bps = defval_instance(cliff_bps, (int, float), 10.0)
+        self.cliff_window = defval_instance(cliff_window, int, 60)
+        self.correction_bps = defval_instance(correction_bps, (int, float), 2.0)
+        self.verification_bps = defval_instance(verification_bps, (int, float), 5.0)
+        self.verification_window = defval_instance(verification_window, int, 20)
+        self.take_profit_bps = defval_instance(take_profit_bps, (int, float), 20.0)
+        self.stop_loss_bps = defval_instance(stop_loss_bps, (int, float), 10.0)
+        self.max_hold = defval_instance(max_hold, int, 600)
+
+    def from_x0(self, *args) -> "SignalConfig":
+        """
+        Returns a config built from a parameter vector in the order of FIELDS, eg. an optimizer's x0. Windows and
+        max_hold are truncated to ints, thresholds are kept as floats.
+        """
+
+        if len(args) > len(self.FIELDS):
+            raise ValueError(f"Expected at most {len(self.FIELDS)} parameters, got {len(args)}.")
+
+        return SignalConfig(**{field: int(arg) if field in self.INT_FIELDS else float(arg) for field, arg in zip(self.FIELDS, args)})
+
+    def __str__(self) -> str:
+        return ', '.join(f"{field}={getattr(self, field)}" for field in self.FIELDS)
+
+
+def _rolling_max(a: np.ndarray, window: int) -> np.ndarray:
+    # van Herk/Gil-Werman: prefix and suffix maxima over blocks of the window length, O(n) for any window
+    n = len(a)
+    a = np.where(np.isnan(a), -np.inf, a)
+
+    if n == 0 or window <= 1:
+        return a
+    elif n < window:
+        # the window never fills, every position sees everything before it
+        return np.maximum.accumulate(a)
+
+    blocks = np.concatenate([a, np.full(-n % window, -np.inf)]).reshape(-1, window)
+    prefix = np.maximum.accumulate(blocks, axis=1).ravel()
+    suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    out = np.maximum.accumulate(a)
+    out[window - 1:] = np.maximum(suffix[:n - window + 1], prefix[window - 1:n])
+
+    return out
+
+
+def _next_true(mask: np.ndarray) -> np.ndarray:
+    # index of the first True at or after every position, len(mask) if there is none
+    n = len(mask)
+    idx = np.where(mask, np.arange(n), n)
+
+    return np.minimum.accumulate(idx[::-1])[::-1]
+
+
+def _first_at_least(a: np.ndarray, threshold: float, start: int) -> int:
+    # index of the first value >= threshold at or after start, len(a) if there is none, scanning in doubling chunks
+    # so the cost is bounded by the distance to it rather than by the rest of the day
+    n, size = len(a), 64
+
+    while start < n:
+        with np.errstate(invalid="ignore"):
+            hits = np.flatnonzero(a[start:start + size] >= threshold)
+
+        if len(hits):
+            return start + int(hits[0])
+
+        start, size = start + size, size * 2
+
+    return n
+
+
+def _detect_day(time: np.ndarray, stock: np.ndarray, index: np.ndarray, config: SignalConfig) -> list[StrategyEvent]:
+    n = len(time)
+    events = []
+
+    def emit(i: int, name: str, value: Any = None) -> None:
+        events.append(StrategyEvent(time=pd.Timestamp(time[i]), name=name, value=value))
+
+    peak = _rolling_max(stock, config.cliff_window)
+
+    with np.errstate(invalid="ignore"):
+        drop = stock <= peak * (1 - bps(config.cliff_bps))
+
+        w = config.verification_window
+        index_ref = np.concatenate([np.full(min(w, n), np.nan), index[:n - w]])
+        index_ok = ~(index < index_ref * (1 - bps(config.verification_bps)))
+
+    cliffs = np.flatnonzero(drop & ~np.concatenate([[False], drop[:-1]]))
+    accept_from = 0
+
+    for i in cliffs:
+        if i < accept_from:
+            continue
+
+        emit(i, "stock cliff")
+
+        level = peak[i] * (1 - bps(config.correction_bps))
+
+        j = _first_at_least(stock, level, i + 1)
+        if j >= n:
+            break
+
+        emit(j, "stock cliff corrected")
+
+        later = np.searchsorted(cliffs, j, side="right")
+        limit = cliffs[later] if later < len(cliffs) else n
+
+        # verification cycles run until the stock and index hold for a full window, or the next cliff, so only
+        # [j, limit + w) is ever looked at. A break past its end is reported at its end, which still completes the window
+        hi = min(n, limit + w)
+
+        with np.errstate(invalid="ignore"):
+            ok = (stock[j:hi] >= level) & index_ok[j:hi]
+
+        next_ok, next_bad = j + _next_true(ok), j + _next_true(~ok)
+
+        p, done = j, None
+        while p < limit:
+            p = next_ok[p - j]
+            if p >= limit:
+                break
+
+            emit(p, "verification part 1")
+
+            b = next_bad[p - j]
+            if b - p >= w:
+                if p + w < n:
+                    done = p + w
+                    emit(done, "verification done")
+                break
+            elif b >= n:
+                # the day ended mid window
+                break
+
+            emit(b, "verification reset")
+            p = b
+
+        if done is None:
+            accept_from = limit
+            continue
+
+        entry = stock[done]
+        emit(done, "signal 1", entry)
+
+        hold = stock[done + 1:min(n, done + 1 + config.max_hold)]
+        with np.errstate(invalid="ignore"):
+            take_profit = hold >= entry * (1 + bps(config.take_profit_bps))
+            stop_loss = hold <= entry * (1 - bps(config.stop_loss_bps))
+
+        hit = take_profit | stop_loss
+        if hit.any():
+            k = int(hit.argmax())
+            emit(done + 1 + k, "signal 2", "take profit" if take_profit[k] else "stop loss")
+        elif len(hold):
+            emit(done + len(hold), "signal 2", "max hold")
+
+        # one trade per day
+        break
+
+    return events
+
+
+def detect(time: np.ndarray, stock: np.ndarray, index: np.ndarray, config: SignalConfig = None) -> list[StrategyEvent]:
+    """
+    Regenerates the strategy events of one or many days of ticks.
+
+    Cliffs are drops of the stock from its rolling high, corrected once the stock recovers to near that high.
+    Verification then requires the stock to hold that level, and the index not to fall, for a full window,
+    restarting on every break. A verified correction buys (signal 1), and the position is sold (signal 2) on take
+    profit, stop loss or after max_hold ticks. At most one trade is made per day.
+
+    Args:
+        time (np.ndarray): Sorted naive datetime64 or int64 nanoseconds.
+        stock (np.ndarray): Stock prices, NaNs are forward filled.
+        index (np.ndarray): Index prices, NaNs are forward filled.
+        config (SignalConfig, optional): Thresholds. Defaults to SignalConfig().
+
+    Returns:
+        list[StrategyEvent]: Events with naive wall clock times.
+    """
+    config = defval_instance(config, SignalConfig, SignalConfig())
+
+    time = to_ns(time)
+    stock = ffill(stock)
+    index = ffill(index)
+
+    if len(time) == 0:
+        return []
+
+    days = np.flatnonzero(np.diff(time // NS_PER_DAY)) + 1
+    bounds = zip(np.concatenate([[0], days]), np.concatenate([days, [len(time)]]))
+
+    return [event for lo, hi in bounds for event in _detect_day(time[lo:hi], stock[lo:hi], index[lo:hi], config)]
+
+
+def diff(recorded: list[StrategyEvent], detected: list[StrategyEvent], tolerance: dt.timedelta = None) -> pd.DataFrame:
+    """
+    Matches detected events against recorded ones by name and nearest wall clock time, each event matching at most one other.
+
+    Args:
+        recorded (list[StrategyEvent]): Events of the live run.
+        detected (list[StrategyEvent]): Events from detect().
+        tolerance (dt.timedelta, optional): Largest time difference of a match. Defaults to 5 seconds.
+
+    Returns:
+        pd.DataFrame: Columns name, recorded, detected, delta (seconds) and status ("matched", "missing" or "extra").
+    """
+    val_instance(recorded, list)
+    val_instance(detected, list)
+    tolerance = defval_instance(tolerance, dt.timedelta, dt.timedelta(seconds=5))
+
+    tolerance_ns = tolerance // dt.timedelta(microseconds=1) * 1_000
+
+    def encode(events: list[StrategyEvent]) -> tuple[np.ndarray, np.ndarray]:
+        if len(events) == 0:
+            return np.array([], dtype="int64"), np.array([], dtype=object)
+
+        time = wall_ns([event.time for event in events])
+        order = np.argsort(time, kind="stable")
+
+        return time[order], np.array([event.name for event in events], dtype=object)[order]
+
+    recorded_time, recorded_name = encode(recorded)
+    detected_time, detected_name = encode(detected)
+
+    frames = []
+    for name in sorted(set(recorded_name) | set(detected_name)):
+        r = recorded_time[recorded_name == name]
+        d = detected_time[detected_name == name]
+
+        # every (recorded, detected) pair within the tolerance
+        lo = np.searchsorted(d, r - tolerance_ns, side="left")
+        counts = np.searchsorted(d, r + tolerance_ns, side="right") - lo
+
+        ri = np.repeat(np.arange(len(r)), counts)
+        dj = np.repeat(lo - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+
+        # greedy one to one matching, closest pairs first, so repeated events can't share a detection
+        match = np.full(len(r), -1)
+        taken = np.zeros(len(d), dtype=bool)
+
+        for k in np.lexsort((ri, np.abs(d[dj] - r[ri]))):
+            if match[ri[k]] < 0 and not taken[dj[k]]:
+                match[ri[k]] = dj[k]
+                taken[dj[k]] = True
+
+        matched = match >= 0
+        extra = np.flatnonzero(~taken)
+
+        # NaT is int64 min
+        detected = np.full(len(r), np.iinfo("int64").min)
+        detected[matched] = d[match[matched]]
+
+        frames.append(pd.DataFrame({
+            "name": name,
+            "recorded": r.astype("datetime64[ns]"),
+            "detected": detected.astype("datetime64[ns]"),
+            "delta": np.where(matched, (detected - r) / 1e9, np.nan),
+            "status": np.where(matched, "matched", "missing"),
+        }))
+        frames.append(pd.DataFrame({
+            "name": name,
+            "recorded": np.full(len(extra), np.datetime64("NaT"), dtype="datetime64[ns]"),
+            "detected": d[extra].astype("datetime64[ns]"),
+            "delta": np.nan,
+            "status": "extra",
+        }))
+
+    if len(frames) == 0:
+        return pd.DataFrame(columns=["name", "recorded", "detected", "delta", "status"])
+
+    return pd.concat(frames, ignore_index=True).sort_values(["recorded", "detected"], ignore_index=True)
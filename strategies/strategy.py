@@ -1,5 +1,7 @@
 from collections import namedtuple
+from time import perf_counter_ns, time_ns
 from types import NoneType
+from _utils.latency import LatencyRecorder
 from _utils.typing import PathLike
 from _utils.val import val_instance
 import datetime as dt
@@ -113,5 +115,64 @@ class Strategy:
     Subclasses must override the next() method.
     """
 
+    latency: LatencyRecorder | None = None
+
     def next(self, *args):
-        raise NotImplementedError("Strategy subclass must override next()")
\ No newline at end of file
+        raise NotImplementedError("Strategy subclass must override next()")
+
+    def instrument(self, enabled: bool = True, tick_lag: bool = False) -> None:
+        """
+        Turns per-call latency instrumentation of next() on or off.
+
+        When on, every call is timed into the "next" histogram of self.latency, and additionally tagged by the command
+        of every StrategyResponse ("command:<command>") and the name of every StrategyEvent ("event:<name>") it returns.
+        When off, next() is the plain method again, so there is no overhead.
+
+        Args:
+            enabled (bool, optional): Turn instrumentation on. Defaults to True.
+            tick_lag (bool, optional): Also record the time from the tick timestamp (the first argument, or the first
+                element of it) to the end of the decision in the "tick lag" histogram. Only meaningful live. Defaults to False.
+        """
+        val_instance(enabled, bool)
+        val_instance(tick_lag, bool)
+
+        self.__dict__.pop("next", None)
+
+        if not enabled:
+            return
+
+        self.latency = LatencyRecorder()
+        self.next = self._timed(self.next, tick_lag)
+
+    def _timed(self, next, tick_lag: bool):
+        record = self.latency.record
+
+        def timed(*args):
+            started = perf_counter_ns()
+            output = next(*args)
+            elapsed = perf_counter_ns() - started
+
+            record("next", elapsed)
+
+            for item in (output if isinstance(output, (list, tuple)) and not hasattr(output, "_fields") else (output,)):
+                if isinstance(item, StrategyResponse):
+                    record(f"command:{item.command}", elapsed)
+                elif isinstance(item, StrategyEvent):
+                    record(f"event:{item.name}", elapsed)
+
+            if tick_lag and args:
+                tick = args[0][0] if isinstance(args[0], (list, tuple)) and args[0] else args[0]
+
+                if isinstance(tick, dt.datetime):
+                    record("tick lag", time_ns() - int(tick.timestamp() * 1_000_000_000))
+
+            return output
+
+        return timed
+
+    def latency_summary(self) -> dict[str, dict]:
+        """
+        Returns the p50/p99/p999 latency summary of every tag, empty if instrumentation was never turned on.
+        """
+
+        return {} if self.latency is None else self.latency.summary()
\ No newline at end of file
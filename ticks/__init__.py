@@ -0,0 +1,4 @@
+from ticks.resample import Bars, FREQUENCIES, asof, ffill, freq_ns, grid, ohlc, resample, to_ns
+from ticks.rview import load, utc_offsets, wall_ns
+from ticks.schema import TickFrame
+from ticks.window import session_window, window_slices
\ No newline at end of file
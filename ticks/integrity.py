@@ -0,0 +1,228 @@
+"""
+Integrity checks for *.rview ticks.
+
+The findings are written next to the file as <file>.meta.json, so renders can trust the order of the ticks without
+checking or sorting them again.
+
+Usage: python -m ticks.integrity <file.rview> [<file.rview> ...]
+"""
+
+import json
+import os
+import sys
+import warnings
+from collections import namedtuple
+
+import numpy as np
+
+from ticks.rview import load
+from ticks.schema import TickFrame
+from _utils.time import NS_PER_DAY, NS_PER_SECOND
+from _utils.typing import PathLike
+from _utils.val import defval_instance, val_instance
+
+# share of out of order rows up to which merging them back in beats a full sort
+NEARLY_SORTED: float = 0.01
+CLOCK_JUMP_NS: int = 60 * NS_PER_SECOND
+
+IntegrityReport = namedtuple("IntegrityReport", ["rows", "sorted", "out_of_order", "duplicates", "clock_jumps", "largest_gap_s", "offsets", "nan_gaps"])
+
+
+class IntegrityWarning(UserWarning):
+    """Issued for integrity problems found in *.rview ticks."""
+    pass
+
+
+class IntegrityException(Exception):
+    """Raised for integrity problems found in *.rview ticks when checking strictly."""
+    pass
+
+
+def _nan_runs(values: np.ndarray) -> dict:
+    missing = np.isnan(values)
+    edges = np.diff(np.concatenate([[0], missing.astype("int8"), [0]]))
+    lengths = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+
+    return {"missing": int(missing.sum()), "gaps": len(lengths), "longest": int(lengths.max()) if len(lengths) else 0}
+
+
+def check(time: np.ndarray, columns: dict[str, np.ndarray], offsets: list[int] = None, clock_jump: int = None) -> IntegrityReport:
+    """
+    Checks ticks for out of order rows, duplicate timestamps, NaN gaps, clock jumps and mixed utc offsets.
+
+    Args:
+        time (np.ndarray): int64 nanoseconds of the naive wall clock times, in file order.
+        columns (dict[str, np.ndarray]): Prices of every instrument, in file order.
+        offsets (list[int], optional): Distinct utc offsets of the original timestamps. Defaults to [].
+        clock_jump (int, optional): Gap within a day, in nanoseconds, that counts as a clock jump. Defaults to 60 seconds.
+
+    Returns:
+        IntegrityReport: The findings.
+    """
+    val_instance(time, np.ndarray)
+    val_instance(columns, dict)
+    clock_jump = defval_instance(clock_jump, int, CLOCK_JUMP_NS)
+
+    out_of_order = int((np.diff(time) < 0).sum())
+
+    # duplicates and gaps are only meaningful between neighbours in time order
+    ordered = np.sort(time) if out_of_order else time
+    step = np.diff(ordered)
+    same_day = (ordered[1:] // NS_PER_DAY) == (ordered[:-1] // NS_PER_DAY)
+
+    intraday = step[same_day]
+
+    return IntegrityReport(
+        rows=len(time),
+        sorted=out_of_order == 0,
+        out_of_order=out_of_order,
+        duplicates=int((step == 0).sum()),
+        clock_jumps=int((intraday > clock_jump).sum()),
+        largest_gap_s=float(intraday.max() / NS_PER_SECOND) if len(intraday) else 0.0,
+        offsets=defval_instance(offsets, list, []),
+        nan_gaps={name: _nan_runs(np.asarray(values, dtype=float)) for name, values in columns.items()},
+    )
+
+
+def problems(report: IntegrityReport) -> list[str]:
+    """
+    Returns a description of every problem in the report. NaN gaps are not problems, instruments tick asynchronously.
+    """
+
+    found = []
+
+    if report.out_of_order:
+        found.append(f"{report.out_of_order} of {report.rows} rows are out of order")
+    if report.duplicates:
+        found.append(f"{report.duplicates} duplicate timestamps")
+    if report.clock_jumps:
+        found.append(f"{report.clock_jumps} clock jumps, the largest gap is {report.largest_gap_s:.0f}s")
+    if len(report.offsets) > 1:
+        found.append(f"mixed utc offsets {report.offsets}")
+
+    return found
+
+
+def sort_order(time: np.ndarray, report: IntegrityReport) -> np.ndarray | None:
+    """
+    Returns the permutation that sorts the ticks, or None if they already are.
+
+    Nearly sorted ticks are fixed up in O(n + k log k): the k rows below the running maximum are taken out, sorted
+    and merged back into the sorted remainder.
+
+    Args:
+        time (np.ndarray): int64 nanoseconds, in file order.
+        report (IntegrityReport): Findings for the same ticks.
+
+    Returns:
+        np.ndarray | None: The permutation.
+    """
+
+    if report.sorted:
+        return None
+
+    if report.out_of_order > NEARLY_SORTED * report.rows:
+        return np.argsort(time, kind="stable")
+
+    late = time < np.maximum.accumulate(time)
+
+    good = np.flatnonzero(~late)
+    bad = np.flatnonzero(late)
+    bad = bad[np.argsort(time[bad], kind="stable")]
+
+    return np.insert(good, np.searchsorted(time[good], time[bad], side="right"), bad)
+
+
+def metadata_path(path: PathLike) -> str:
+    return f"{os.fsdecode(path)}.meta.json"
+
+
+def write_metadata(path: PathLike, report: IntegrityReport) -> None:
+    """
+    Writes the report next to the *.rview file, stamped with the file's size and modification time.
+    """
+    val_instance(path, PathLike)
+
+    stat = os.stat(path)
+
+    with open(metadata_path(path), "w") as f:
+        json.dump({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "integrity": report._asdict()}, f, indent=4)
+
+
+def read_metadata(path: PathLike) -> IntegrityReport | None:
+    """
+    Reads the report written for the *.rview file.
+
+    Returns:
+        IntegrityReport | None: The report, or None if there is none or the file changed since it was written.
+    """
+    val_instance(path, PathLike)
+
+    try:
+        with open(metadata_path(path), "r") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    stat = os.stat(path)
+
+    if meta.get("size") != stat.st_size or meta.get("mtime_ns") != stat.st_mtime_ns:
+        return None
+
+    try:
+        return IntegrityReport(**meta["integrity"])
+    except (KeyError, TypeError):
+        return None
+
+
+def report_problems(report: IntegrityReport, source: str, strict: bool = False) -> None:
+    """
+    Warns about, or with strict raises for, the problems in the report.
+
+    Raises:
+        IntegrityException: If strict and there are problems.
+    """
+
+    found = problems(report)
+
+    if not found:
+        return
+
+    message = f"{source}: {'; '.join(found)}."
+
+    if strict:
+        raise IntegrityException(message)
+
+    warnings.warn(message, IntegrityWarning, stacklevel=3)
+
+
+def check_rview(path: PathLike, write: bool = True) -> IntegrityReport:
+    """
+    Checks an *.rview file and writes the findings next to it.
+
+    Args:
+        path (PathLike): Path to the *.rview file.
+        write (bool, optional): Write the metadata file. Defaults to True.
+
+    Returns:
+        IntegrityReport: The findings.
+    """
+    val_instance(path, PathLike)
+
+    data, _, _ = load(path)
+    frame = TickFrame.from_data(data)
+
+    report = check(frame.time, frame.columns(), frame.offsets)
+
+    if write:
+        write_metadata(path, report)
+
+    return report
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        report = check_rview(path)
+        found = problems(report)
+
+        print(f"{path}: {'; '.join(found) if found else 'ok'}")
@@ -0,0 +1,199 @@
+from collections import namedtuple
+from typing import Any
+
+import numpy as np
+
+from _utils.val import val_instance
+
+FREQUENCIES: dict[str, int] = {
+    "1s": 1_000_000_000,
+    "5s": 5_000_000_000,
+    "1m": 60_000_000_000,
+}
+
+Bars = namedtuple("Bars", ["time", "open", "high", "low", "close", "count"])
+
+
+def freq_ns(freq: str) -> int:
+    """
+    Returns the length of a resampling frequency in nanoseconds.
+
+    Args:
+        freq (str): One of the keys of FREQUENCIES. eg. "1s", "5s", "1m".
+
+    Raises:
+        ValueError: If the frequency is not supported.
+
+    Returns:
+        int: Length of the frequency in nanoseconds.
+    """
+    val_instance(freq, str)
+
+    if freq not in FREQUENCIES:
+        raise ValueError(
+            f"Unsupported frequency '{freq}', expected one of {', '.join(FREQUENCIES)}.")
+
+    return FREQUENCIES[freq]
+
+
+def to_ns(time: Any) -> np.ndarray:
+    """
+    Returns the times as an int64 array of nanoseconds.
+
+    Args:
+        time (Any): A datetime64 array (any unit), an int64 array of nanoseconds or a pandas Series of either.
+
+    Returns:
+        np.ndarray: int64 nanoseconds.
+    """
+
+    time = np.asarray(time)
+
+    if np.issubdtype(time.dtype, np.datetime64):
+        return time.astype("datetime64[ns]").view("int64")
+    elif np.issubdtype(time.dtype, np.integer):
+        return time.astype("int64", copy=False)
+
+    raise TypeError(
+        f"Expected datetime64 or int64 values for 'time', got {time.dtype}.")
+
+
+def ffill(values: Any) -> np.ndarray:
+    """
+    Forward fills NaNs along the first axis, leading NaNs are kept.
+
+    Args:
+        values (Any): 1-d or 2-d array-like of floats.
+
+    Returns:
+        np.ndarray: Filled copy of values.
+    """
+
+    values = np.asarray(values, dtype=float)
+    rows = np.arange(len(values)).reshape((-1,) + (1,) * (values.ndim - 1))
+    last = np.where(np.isnan(values), 0, rows)
+    last = np.maximum.accumulate(last, axis=0)
+
+    filled = np.take_along_axis(values, np.broadcast_to(last, values.shape), axis=0)
+
+    return filled
+
+
+def asof(time: Any, ref_time: Any, ref_values: Any, tolerance: int = None) -> np.ndarray:
+    """
+    As-of join: for every entry of time, the last value of ref_values at or before it.
+
+    Args:
+        time (Any): Sorted times to look values up for.
+        ref_time (Any): Sorted times of the reference series.
+        ref_values (Any): Values of the reference series, 1-d or 2-d along the first axis.
+        tolerance (int, optional): Maximum age of a matched value in nanoseconds. Defaults to no limit.
+
+    Returns:
+        np.ndarray: Joined values, NaN where there is no match.
+    """
+
+    time = to_ns(time)
+    ref_time = to_ns(ref_time)
+    ref_values = np.asarray(ref_values, dtype=float)
+
+    if len(ref_time) == 0:
+        return np.full((len(time),) + ref_values.shape[1:], np.nan)
+
+    idx = np.searchsorted(ref_time, time, side="right") - 1
+    missing = idx < 0
+    idx = np.maximum(idx, 0)
+
+    if tolerance is not None:
+        missing |= (time - ref_time[idx]) > tolerance
+
+    joined = ref_values[idx]
+    joined[missing] = np.nan
+
+    return joined
+
+
+def grid(start: Any, end: Any, freq: str) -> np.ndarray:
+    """
+    Returns a uniform time grid covering [start, end], aligned to multiples of freq.
+
+    Args:
+        start (Any): First time (datetime64 or int64 nanoseconds).
+        end (Any): Last time (datetime64 or int64 nanoseconds).
+        freq (str): Grid frequency. eg. "1s", "5s", "1m".
+
+    Returns:
+        np.ndarray: datetime64[ns] grid.
+    """
+
+    step = freq_ns(freq)
+    start, end = to_ns(np.array([start, end]))
+
+    first = start - start % step
+
+    return np.arange(first, end + 1, step).astype("datetime64[ns]")
+
+
+def resample(time: Any, values: Any, freq: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Samples an irregular series on a uniform grid, taking the last known value at each grid point.
+
+    Args:
+        time (Any): Sorted tick times.
+        values (Any): Tick values, 1-d or 2-d along the first axis. NaNs are forward filled.
+        freq (str): Grid frequency. eg. "1s", "5s", "1m".
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The grid and the sampled values.
+    """
+
+    time = to_ns(time)
+
+    if len(time) == 0:
+        return np.array([], dtype="datetime64[ns]"), np.asarray(values, dtype=float)
+
+    _grid = grid(time[0], time[-1], freq)
+
+    return _grid, asof(_grid, time, ffill(values))
+
+
+def ohlc(time: Any, values: Any, freq: str) -> Bars:
+    """
+    Aggregates ticks into open, high, low, close bars. NaN ticks are ignored and empty bins are dropped.
+
+    Args:
+        time (Any): Sorted tick times.
+        values (Any): 1-d tick values.
+        freq (str): Bar length. eg. "1s", "5s", "1m".
+
+    Returns:
+        Bars: Bar start times (datetime64[ns]) and their open, high, low, close and tick count.
+    """
+
+    step = freq_ns(freq)
+    time = to_ns(time)
+    values = np.asarray(values, dtype=float)
+
+    keep = ~np.isnan(values)
+    time, values = time[keep], values[keep]
+
+    if len(time) == 0:
+        empty = np.array([], dtype=float)
+        return Bars(np.array([], dtype="datetime64[ns]"), empty, empty, empty, empty, np.array([], dtype=int))
+
+    edges = np.arange(time[0] - time[0] % step, time[-1] + 1, step)
+
+    starts = np.searchsorted(time, edges, side="left")
+    ends = np.append(starts[1:], len(time))
+
+    nonempty = ends > starts
+    starts, ends = starts[nonempty], ends[nonempty]
+
+    return Bars(
+        time=edges[nonempty].astype("datetime64[ns]"),
+        open=values[starts],
+        high=np.maximum.reduceat(values, starts),
+        low=np.minimum.reduceat(values, starts),
+        close=values[ends - 1],
+        count=ends - starts,
+    )
@@ -0,0 +1,75 @@
+import pickle
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from _utils.typing import PathLike
+from _utils.val import val_instance
+
+
+def load(path: PathLike) -> tuple[list, list, list]:
+    """
+    Loads an *.rview file.
+
+    Args:
+        path (PathLike): Path to the *.rview file.
+
+    Returns:
+        tuple[list, list, list]: The ticks, events and results stored in the file.
+    """
+    val_instance(path, PathLike)
+
+    with open(path, "rb") as f:
+        data, events, results = pickle.load(f)
+
+    return data, events, results
+
+
+def wall_ns(times: Any) -> np.ndarray:
+    """
+    Returns the wall clock times of timezone aware datetimes as int64 nanoseconds, dropping the timezone.
+
+    Args:
+        times (Any): Iterable of datetime or Timestamp objects, or a pandas Series of them.
+
+    Returns:
+        np.ndarray: int64 nanoseconds of the naive wall clock times.
+    """
+
+    try:
+        index = pd.DatetimeIndex(times)
+    except (TypeError, ValueError):
+        # mixed utc offsets can't be held in a single DatetimeIndex
+        index = pd.DatetimeIndex([t.replace(tzinfo=None) for t in times])
+
+    if index.tz is not None:
+        index = index.tz_localize(None)
+
+    return index.to_numpy().astype("datetime64[ns]").view("int64")
+
+
+
+def utc_offsets(times: Any) -> list[int]:
+    """
+    Returns the distinct utc offsets of timezone aware datetimes.
+
+    Args:
+        times (Any): Iterable of datetime or Timestamp objects, or a pandas Series of them.
+
+    Returns:
+        list[int]: Sorted offsets in seconds, empty for naive datetimes.
+    """
+
+    try:
+        index = pd.DatetimeIndex(times)
+    except (TypeError, ValueError):
+        # mixed utc offsets can't be held in a single DatetimeIndex
+        return sorted({int(t.utcoffset().total_seconds()) for t in times if t.utcoffset() is not None})
+
+    if index.tz is None or len(index) == 0:
+        return []
+
+    offsets = (index.tz_localize(None) - index.tz_convert(None)).total_seconds()
+
+    return [int(offset) for offset in np.unique(offsets)]
@@ -0,0 +1,130 @@
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ticks.rview import utc_offsets, wall_ns
+from _utils.val import defval_instance, val_instance
+
+LEGACY_NAMES: list[str] = ["INDEX", "STOCK"]
+
+
+class TickFrame:
+    """
+    Ticks of any number of named instruments, one column per instrument.
+
+    time is int64 nanoseconds of naive wall clock times, values is a float array of shape (rows, instruments) with
+    NaN where an instrument didn't tick. *.rview files store either a TickFrame or the legacy [time, index, stock] rows.
+    """
+
+    def __init__(self, time: np.ndarray, names: list[str], values: np.ndarray, offsets: list[int] = None) -> None:
+        """
+        Args:
+            time (np.ndarray): int64 nanoseconds of naive wall clock times.
+            names (list[str]): Instrument names.
+            values (np.ndarray): Prices, shape (rows, instruments).
+            offsets (list[int], optional): Distinct utc offsets of the original timestamps, in seconds. Defaults to [].
+        """
+        val_instance(time, np.ndarray)
+        val_instance(names, list)
+        val_instance(values, np.ndarray)
+
+        if values.size != len(time) * len(names):
+            raise ValueError(f"Expected {len(time)} rows of {len(names)} prices, got values of shape {values.shape}.")
+
+        values = values.reshape(len(time), len(names)).astype(float, copy=False)
+
+        if len(set(names)) != len(names):
+            raise ValueError(f"Instrument names must be unique, got {names}.")
+
+        self.time = time
+        self.names = names
+        self.values = values
+        self.offsets = defval_instance(offsets, list, [])
+
+    @classmethod
+    def from_rows(cls, rows: list, names: list[str] = None) -> "TickFrame":
+        """
+        Builds a frame from [time, price, price, ...] rows.
+
+        Args:
+            rows (list): Rows of a timezone aware timestamp followed by one price per instrument.
+            names (list[str], optional): Instrument names. Defaults to ["INDEX", "STOCK"].
+
+        Returns:
+            TickFrame: The frame.
+        """
+        names = defval_instance(names, list, LEGACY_NAMES)
+
+        df = pd.DataFrame(rows, columns=["TIME"] + names)
+
+        return cls(wall_ns(df["TIME"]), names, df[names].to_numpy(dtype=float), utc_offsets(df["TIME"]))
+
+    @classmethod
+    def from_long(cls, time: np.ndarray, codes: np.ndarray, prices: np.ndarray, symbols: list[str]) -> "TickFrame":
+        """
+        Builds a frame from long format ticks: one row per (time, symbol code, price). Later duplicates win.
+
+        Args:
+            time (np.ndarray): int64 nanoseconds of naive wall clock times, or datetime64.
+            codes (np.ndarray): Index into symbols of every tick.
+            prices (np.ndarray): Price of every tick.
+            symbols (list[str]): Instrument names.
+
+        Returns:
+            TickFrame: The frame, with one row per distinct time.
+        """
+        val_instance(symbols, list)
+
+        time = np.asarray(time)
+        if np.issubdtype(time.dtype, np.datetime64):
+            time = time.astype("datetime64[ns]").view("int64")
+
+        unique, row = np.unique(time, return_inverse=True)
+
+        values = np.full((len(unique), len(symbols)), np.nan)
+        values[row, np.asarray(codes)] = np.asarray(prices, dtype=float)
+
+        return cls(unique, symbols, values)
+
+    @classmethod
+    def from_data(cls, data: Any, names: list[str] = None) -> "TickFrame":
+        """
+        Returns the ticks of an *.rview file as a frame, whichever way they were stored.
+        """
+
+        if isinstance(data, TickFrame):
+            return data
+
+        return cls.from_rows(data, names)
+
+    def to_long(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the ticks in long format, leaving out NaNs.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Times, symbol codes and prices.
+        """
+
+        row, code = np.nonzero(~np.isnan(self.values))
+
+        return self.time[row], code, self.values[row, code]
+
+    def column(self, name: str) -> np.ndarray:
+        return self.values[:, self.names.index(name)]
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return {name: self.values[:, i] for i, name in enumerate(self.names)}
+
+    def take(self, rows: Any) -> "TickFrame":
+        """
+        Returns a frame of the selected rows.
+        """
+
+        return TickFrame(self.time[rows], self.names, self.values[rows], self.offsets)
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __str__(self) -> str:
+        return f"TickFrame({len(self)} rows, {', '.join(self.names)})"
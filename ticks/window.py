@@ -0,0 +1,88 @@
+import datetime as dt
+from types import NoneType
+from typing import Iterable
+
+import numpy as np
+
+from strategies.strategy import StrategyResults
+from _utils.time import NS_PER_DAY, TimeRange
+from _utils.val import defval_instance, val_instance
+
+
+DEFAULT_WINDOW = TimeRange(dt.time(9, 25, 0), dt.time(9, 50, 0))
+DEFAULT_PADDING = dt.timedelta(minutes=2)
+
+
+def session_window(results: StrategyResults | Iterable[StrategyResults] | None, padding: dt.timedelta = None, default: TimeRange = None) -> TimeRange:
+    """
+    Returns the window of the day worth showing for a session.
+
+    The window starts at the start of default, or earlier if the first buy is earlier, and ends padding after the last sell.
+    Without a sell the end of default is used.
+
+    Args:
+        results (StrategyResults | Iterable[StrategyResults] | None): Results of the session.
+        padding (dt.timedelta, optional): Time shown around the trades. Defaults to 2 minutes.
+        default (TimeRange, optional): Window used when there were no trades. Defaults to 9:25 - 9:50.
+
+    Returns:
+        TimeRange: The session window.
+    """
+    val_instance(results, (StrategyResults, Iterable, NoneType))
+    padding = defval_instance(padding, dt.timedelta, DEFAULT_PADDING)
+    default = defval_instance(default, TimeRange, DEFAULT_WINDOW)
+
+    if results is None:
+        results = []
+    elif isinstance(results, StrategyResults):
+        results = [results]
+
+    buys = [r.buy_time for r in results if r.buy_time is not None]
+    sells = [r.sell_time for r in results if r.sell_time is not None]
+
+    start = default.start
+    end = default.end
+
+    if buys:
+        start = min(start, (min(buys) - padding).time())
+
+    if sells:
+        end = (max(sells) + padding).time()
+
+    return TimeRange(start, end)
+
+
+def window_slices(time: np.ndarray, window: TimeRange) -> list[slice]:
+    """
+    Returns the row slices of sorted times that fall within the window, one per day (two for windows wrapping midnight).
+
+    Uses binary search, so only O(days * log n) work is done regardless of how many rows there are.
+
+    Args:
+        time (np.ndarray): Sorted int64 nanoseconds of naive wall clock times.
+        window (TimeRange): Window of the day.
+
+    Returns:
+        list[slice]: Slices of rows in the window.
+    """
+    val_instance(time, np.ndarray)
+    val_instance(window, TimeRange)
+
+    if len(time) == 0:
+        return []
+
+    if window.wraps:
+        bounds = [(0, window.end_ns), (window.start_ns, NS_PER_DAY - 1)]
+    else:
+        bounds = [(window.start_ns, window.end_ns)]
+
+    slices = []
+    for day in range(time[0] // NS_PER_DAY, time[-1] // NS_PER_DAY + 1):
+        for _from, _to in bounds:
+            lo = np.searchsorted(time, day * NS_PER_DAY + _from, side="left")
+            hi = np.searchsorted(time, day * NS_PER_DAY + _to, side="right")
+
+            if hi > lo:
+                slices.append(slice(int(lo), int(hi)))
+
+    return slices
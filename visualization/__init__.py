@@ -1 +1,2 @@
-from visualization.view import view
\ No newline at end of file
+from visualization.view import build, render, view
+from visualization.report import report
\ No newline at end of file
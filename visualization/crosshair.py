@@ -0,0 +1,106 @@
+import numpy as np
+
+from bokeh.events import MouseLeave, MouseMove
+from bokeh.models import ColumnDataSource, CustomJS, Span
+from bokeh.plotting import figure
+
+from strategies.strategy import StrategyEvent
+from ticks.rview import wall_ns
+
+# Both lookups are binary searches over the sorted time columns, so the cost per mouse move is O(log n)
+# no matter how many ticks are on the chart, unlike HoverTool hit testing every glyph.
+_ON_MOVE = """
+const t = ticks.data.TIME;
+const n = t.length;
+if (n == 0)
+    return;
+
+function nearest(times, x) {
+    let lo = 0, hi = times.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (times[mid] < x) lo = mid + 1; else hi = mid;
+    }
+    if (lo == times.length || (lo > 0 && x - times[lo - 1] <= times[lo] - x))
+        lo -= 1;
+    return lo;
+}
+
+function fmt(ms) {
+    return new Date(ms).toISOString().substring(11, 19);
+}
+
+const i = nearest(t, cb_obj.x);
+const stock = ticks.data.STOCK[i];
+const index = ticks.data.INDEX[i];
+
+vline.location = t[i];
+stock_line.location = stock;
+index_line.location = index;
+vline.visible = stock_line.visible = index_line.visible = true;
+
+let text = `${fmt(t[i])}   STOCK ${stock.toFixed(2)}   INDEX ${index.toFixed(2)}`;
+
+if (events.data.TIME.length > 0) {
+    const j = nearest(events.data.TIME, t[i]);
+    const delta = (t[i] - events.data.TIME[j]) / 1000;
+    text += `   |   ${events.data.NAME[j]} @ ${fmt(events.data.TIME[j])} (${delta >= 0 ? "+" : ""}${delta.toFixed(0)}s)`;
+}
+
+plot.title.text = text;
+"""
+
+_ON_LEAVE = """
+vline.visible = stock_line.visible = index_line.visible = false;
+"""
+
+
+def event_source(events: list[StrategyEvent]) -> ColumnDataSource:
+    """
+    Returns the events as a source sorted by time.
+
+    Args:
+        events (list[StrategyEvent]): Events.
+
+    Returns:
+        ColumnDataSource: Source with TIME (naive wall clock) and NAME columns.
+    """
+
+    if len(events) == 0:
+        return ColumnDataSource(data={"TIME": np.array([], dtype="datetime64[ns]"), "NAME": []})
+
+    time = wall_ns([event.time for event in events])
+    order = np.argsort(time, kind="stable")
+
+    return ColumnDataSource(data={
+        "TIME": time[order].astype("datetime64[ns]"),
+        "NAME": [events[i].name for i in order],
+    })
+
+
+def add_crosshair(plot: figure, ticks: ColumnDataSource, events: list[StrategyEvent] | ColumnDataSource, index_range_name: str) -> None:
+    """
+    Adds a crosshair that snaps to the exact tick under the cursor, marks its STOCK and INDEX prices on their own
+    axes and shows the tick and the nearest event in the plot title.
+
+    Args:
+        plot (figure): Plot to add the crosshair to.
+        ticks (ColumnDataSource): Source with sorted TIME, STOCK and INDEX columns.
+        events (list[StrategyEvent] | ColumnDataSource): Events of the session, or a source with sorted TIME and NAME columns.
+        index_range_name (str): Name of the y range the index is plotted against.
+    """
+
+    vline = Span(dimension="height", line_color="#555555", line_dash="dotted", line_width=1, visible=False)
+    stock_line = Span(dimension="width", line_color="#3063f0", line_dash="dashed", line_width=1, visible=False)
+    index_line = Span(dimension="width", line_color="#ff6d00", line_dash="dashed", line_width=1, visible=False, y_range_name=index_range_name)
+
+    for span in (vline, stock_line, index_line):
+        plot.add_layout(span)
+
+    if not isinstance(events, ColumnDataSource):
+        events = event_source(events)
+
+    args = dict(plot=plot, ticks=ticks, events=events, vline=vline, stock_line=stock_line, index_line=index_line)
+
+    plot.js_on_event(MouseMove, CustomJS(args=args, code=_ON_MOVE))
+    plot.js_on_event(MouseLeave, CustomJS(args=args, code=_ON_LEAVE))
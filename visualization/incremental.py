@@ -0,0 +1,386 @@
+"""
+Incremental html regeneration for intraday reports.
+
+refresh() renders an *.rview file to an html shell once and keeps the data out of it, in files next to it that only
+ever grow:
+
+    <output>.ticks.bin     float64 rows of [time (ms), price, price, ...], little endian
+    <output>.events.jsonl  one {"marks", "labels"} object of event_marks() columns per refresh that found new events
+    <output>.state.json    what was processed so far, the chart options and the generation of the files
+
+Every later refresh only converts and appends the ticks and events recorded since the previous one, and the shell
+fetches whatever it hasn't seen yet (with a Range request) and streams it into its sources. When the files have to be
+rebuilt their generation changes, and open shells clear their sources and read them again from the start.
+
+The chart is made of the same pieces as view(): the session window, the integrity checked sort, the event lines and
+labels and the crosshair. Its ranges follow the data instead of being fixed, and bars, the lead-lag panel and bps
+normalization are left to view().
+
+The shell loads its data with fetch(), so it must be served over http, eg. python -m http.server, rather than opened
+as a file. Servers ignoring Range requests work too, they just send more bytes.
+
+Usage: python -m visualization.incremental <file.rview> <output.html> [--every 120]
+"""
+
+import argparse
+import datetime as dt
+import json
+import os
+import pickle
+import time
+
+import numpy as np
+
+from strategies.strategy import StrategyResults
+from ticks.integrity import check, report_problems, sort_order
+from ticks.resample import ffill
+from ticks.rview import load
+from ticks.schema import LEGACY_NAMES, TickFrame
+from ticks.window import session_window, window_slices
+from visualization.crosshair import add_crosshair
+from visualization.view import _palette, event_marks, plot_events
+from _utils.time import TimeRange
+from _utils.typing import PathLike
+from _utils.val import defval_instance, val_instance
+
+from bokeh.document import Document
+from bokeh.embed import file_html
+from bokeh.events import DocumentReady
+from bokeh.layouts import gridplot
+from bokeh.models import ColumnDataSource, CustomJS, DataRange1d, LinearAxis
+from bokeh.plotting import figure
+from bokeh.resources import CDN
+
+POLL_INTERVAL_MS = 5_000
+
+_POLL = """
+const width = 8 * (1 + names.length);
+let tick_offset = 0, event_offset = 0, generation = null;
+
+function empty(columns) {
+    return Object.fromEntries(columns.map((column) => [column, []]));
+}
+
+async function fetch_from(url, offset) {
+    const response = await fetch(url, {headers: {Range: `bytes=${offset}-`}, cache: "no-store"});
+
+    if (response.status == 416 || !response.ok)
+        return new ArrayBuffer(0);
+
+    const buffer = await response.arrayBuffer();
+
+    // a server ignoring the Range header sends the whole file
+    return response.status == 206 ? buffer : buffer.slice(offset);
+}
+
+async function poll() {
+    try {
+        const response = await fetch(state_url, {cache: "no-store"});
+
+        if (response.ok) {
+            const state = await response.json();
+
+            if (generation !== null && state.generation !== generation) {
+                // a different set of instruments needs a different shell
+                if (JSON.stringify(state.names) !== JSON.stringify(names)) {
+                    location.reload();
+                    return;
+                }
+
+                // the files were rebuilt, the offsets into the old ones mean nothing
+                ticks.data = empty(["TIME", ...names]);
+                marks.data = empty(Object.keys(marks.data));
+                labels.data = empty(Object.keys(labels.data));
+                tick_offset = event_offset = 0;
+            }
+
+            generation = state.generation;
+        }
+
+        const buffer = await fetch_from(ticks_url, tick_offset);
+        const usable = buffer.byteLength - buffer.byteLength % width;
+
+        if (usable > 0) {
+            const values = new Float64Array(buffer.slice(0, usable));
+            const columns = 1 + names.length;
+            const rows = usable / width;
+
+            const data = {TIME: new Float64Array(rows)};
+            names.forEach((name) => data[name] = new Float64Array(rows));
+
+            for (let i = 0; i < rows; i++) {
+                data.TIME[i] = values[i * columns];
+                names.forEach((name, k) => data[name][i] = values[i * columns + k + 1]);
+            }
+
+            ticks.stream(data);
+            tick_offset += usable;
+        }
+
+        const text = new TextDecoder().decode(await fetch_from(events_url, event_offset));
+        const complete = text.lastIndexOf("\\n") + 1;
+
+        if (complete > 0) {
+            for (const line of text.substring(0, complete).split("\\n").filter((line) => line.length > 0)) {
+                const chunk = JSON.parse(line);
+
+                marks.stream(chunk.marks);
+                labels.stream(chunk.labels);
+            }
+
+            // the crosshair binary searches the marks, chunks of later refreshes may reach back in time
+            const order = marks.data.TIME.map((_, i) => i).sort((a, b) => marks.data.TIME[a] - marks.data.TIME[b]);
+            marks.data = Object.fromEntries(Object.entries(marks.data).map(([column, values]) => [column, order.map((i) => values[i])]));
+
+            event_offset += new TextEncoder().encode(text.substring(0, complete)).length;
+        }
+    } catch (error) {
+        console.warn(error);
+    }
+
+    setTimeout(poll, interval);
+}
+
+poll();
+"""
+
+
+def _paths(output: PathLike) -> tuple[str, str, str]:
+    stem = os.path.splitext(os.fsdecode(output))[0]
+
+    return f"{stem}.ticks.bin", f"{stem}.events.jsonl", f"{stem}.state.json"
+
+
+def _read_state(path: str) -> dict | None:
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_state(path: str, state: dict) -> None:
+    # written to the side and renamed so a crash never leaves a half written state
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(state, f, indent=4)
+
+    os.replace(f"{path}.tmp", path)
+
+
+def _shell(names: list[str], crosshair: bool, ticks_url: str, events_url: str, state_url: str, title: str) -> str:
+    ticks = ColumnDataSource(data={"TIME": [], **{name: [] for name in names}})
+
+    marks, labels = event_marks([])
+    marks, labels = ColumnDataSource(data=marks), ColumnDataSource(data=labels)
+
+    plot = figure(x_axis_type="datetime", title="Graph", tools="freehand_draw,poly_draw,poly_edit,pan,box_zoom,wheel_zoom,undo,redo,reset,save")
+
+    plot_events(plot, marks, labels)
+
+    plot.grid.grid_line_alpha = 0.3
+    plot.xaxis.axis_label = 'Time'
+
+    pair = sorted(names) == sorted(LEGACY_NAMES)
+
+    if pair:
+        stock = plot.line("TIME", "STOCK", source=ticks, color='#3063f0', legend_label='Stock')
+        index = plot.line("TIME", "INDEX", source=ticks, color='#ff6d00', legend_label='Index', y_range_name="index_range")
+
+        # the ranges follow the streamed ticks, view() fixes them to the data it has
+        plot.y_range = DataRange1d(renderers=[stock])
+        plot.extra_y_ranges = {"index_range": DataRange1d(renderers=[index])}
+
+        plot.add_layout(LinearAxis(y_range_name="index_range"), 'right')
+        plot.yaxis.axis_label = 'Price'
+
+        if crosshair:
+            add_crosshair(plot, ticks, marks, "index_range")
+    else:
+        colors = _palette(len(names))
+
+        for i, name in enumerate(names):
+            y_range_name = "default" if i == 0 else name
+            line = plot.line("TIME", name, source=ticks, color=colors[i], legend_label=name, y_range_name=y_range_name)
+
+            if i == 0:
+                plot.y_range = DataRange1d(renderers=[line])
+                plot.yaxis.axis_label = name
+            else:
+                plot.extra_y_ranges[name] = DataRange1d(renderers=[line])
+                plot.add_layout(LinearAxis(y_range_name=name, axis_label=name, axis_line_color=colors[i], major_label_text_color=colors[i]), 'right')
+
+        plot.legend.click_policy = "hide"
+
+    plot.legend.location = "top_left"
+
+    document = Document()
+    document.add_root(gridplot([[plot]], sizing_mode="stretch_both"))
+    document.js_on_event(DocumentReady, CustomJS(
+        args=dict(ticks=ticks, marks=marks, labels=labels, names=names, ticks_url=ticks_url, events_url=events_url, state_url=state_url, interval=POLL_INTERVAL_MS),
+        code=_POLL,
+    ))
+
+    return file_html(document, CDN, title)
+
+
+def _events_line(events: list, window: TimeRange) -> str:
+    marks, labels = event_marks(events, window)
+
+    if len(marks["TIME"]) == 0:
+        return ""
+
+    # datetime64 to the milliseconds bokeh uses
+    marks["TIME"] = (marks["TIME"].view("int64") / 1_000_000).tolist()
+    labels["TIME"] = (labels["TIME"].view("int64") / 1_000_000).tolist()
+
+    return json.dumps({"marks": marks, "labels": labels}) + "\n"
+
+
+def _sorted(frame: TickFrame, source: str, strict: bool) -> TickFrame:
+    report = check(frame.time, frame.columns(), frame.offsets)
+    report_problems(report, source, strict)
+
+    order = sort_order(frame.time, report)
+
+    return frame if order is None else frame.take(order)
+
+
+def refresh(path: PathLike, output: PathLike, names: list[str] = None, interpolate: bool = None, window: TimeRange = None, padding: dt.timedelta = None, crosshair: bool = None, strict: bool = None) -> int:
+    """
+    Brings the incremental html report of an *.rview file up to date, appending only what was recorded since the last refresh.
+
+    New ticks are integrity checked and sorted like in view(), and only those within the window are appended. The
+    files are rebuilt when the file no longer extends what was processed (eg. it was replaced, or new ticks reach back
+    before the appended ones) or the chart changes (the instruments, the options or the session window, which moves
+    once results come in).
+
+    The *.rview file is still unpickled whole, pickle can't be read partially, but only the new rows and events are
+    converted and written.
+
+    Args:
+        path (PathLike): Path to the *.rview file.
+        output (PathLike): Path of the html shell to write.
+        names (list[str], optional): Instrument names of legacy rows. Defaults to ["INDEX", "STOCK"].
+        interpolate (bool, optional): Forward fill missing prices. Defaults to False.
+        window (TimeRange, optional): Window of the day to chart. Defaults to the session window of the results.
+        padding (dt.timedelta, optional): Padding of the session window. Defaults to DEFAULT_PADDING.
+        crosshair (bool, optional): Add the crosshair (with INDEX and STOCK instruments). Defaults to True.
+        strict (bool, optional): Raise instead of warning on integrity problems. Defaults to False.
+
+    Returns:
+        int: Number of rows appended.
+    """
+    val_instance(path, PathLike)
+    val_instance(output, PathLike)
+    names = defval_instance(names, list, None)
+    interpolate = defval_instance(interpolate, bool, False)
+    window = defval_instance(window, TimeRange, None)
+    crosshair = defval_instance(crosshair, bool, True)
+    strict = defval_instance(strict, bool, False)
+
+    ticks_path, events_path, state_path = _paths(output)
+    source = os.fsdecode(path)
+
+    data, events, results = load(path)
+    results: list[StrategyResults]
+
+    rows = len(data)
+    state = _read_state(state_path) or {}
+
+    frame_names = data.names if isinstance(data, TickFrame) else (names or LEGACY_NAMES)
+    width = 8 * (1 + len(frame_names))
+
+    window = window or session_window(results, padding)
+    options = {"window": str(window), "interpolate": interpolate, "crosshair": crosshair}
+
+    def new_rows(start: int) -> TickFrame:
+        frame = data.take(slice(start, None)) if isinstance(data, TickFrame) else TickFrame.from_rows(data[start:], frame_names)
+
+        return _sorted(frame, source, strict)
+
+    def start_over(generation: int) -> dict:
+        # the new generation is published right after truncating so open shells reset as soon as possible
+        state = {"names": frame_names, "options": options, "rows": 0, "events": 0, "written": 0, "last_time": None, "last_values": None, "generation": generation, "source": source}
+
+        open(ticks_path, "wb").close()
+        open(events_path, "w").close()
+        _write_state(state_path, state)
+
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(_shell(frame_names, crosshair, os.path.basename(ticks_path), os.path.basename(events_path), os.path.basename(state_path), os.path.splitext(os.path.basename(source))[0]))
+
+        return state
+
+    if (
+        state.get("names") != frame_names
+        or state.get("options") != options
+        or state.get("rows", 0) > rows
+        or state.get("events", 0) > len(events)
+        or not os.path.exists(output)
+        or not os.path.exists(ticks_path)
+        or os.path.getsize(ticks_path) != state.get("written", 0) * width
+    ):
+        state = start_over(state.get("generation", 0) + 1)
+
+    frame = new_rows(state["rows"]) if rows > state["rows"] else None
+
+    if frame is not None and state["last_time"] is not None and len(frame) and frame.time[0] < state["last_time"]:
+        # the new ticks reach back before the appended ones, they can't be appended in order
+        state = start_over(state["generation"] + 1)
+        frame = new_rows(0)
+
+    appended = 0
+
+    if frame is not None and len(frame):
+        last_time = int(frame.time[-1])
+
+        slices = window_slices(frame.time, window)
+        frame = frame.take(np.concatenate([np.arange(s.start, s.stop) for s in slices] or [np.array([], dtype=int)]))
+
+        if interpolate and len(frame):
+            # filled on from the last appended prices
+            previous = np.array([state["last_values"]], dtype=float) if state["last_values"] is not None else np.full((1, len(frame_names)), np.nan)
+            frame.values = ffill(np.concatenate([previous, frame.values]))[1:]
+
+        if len(frame):
+            block = np.column_stack([frame.time / 1_000_000, frame.values]).astype("<f8")
+
+            with open(ticks_path, "ab") as f:
+                f.write(block.tobytes())
+
+            state["last_values"] = frame.values[-1].tolist()
+
+        appended = len(frame)
+        state["written"] += appended
+        state["last_time"] = last_time
+
+    with open(events_path, "a") as f:
+        f.write(_events_line(events[state["events"]:], window))
+
+    _write_state(state_path, {**state, "rows": rows, "events": len(events)})
+
+    return appended
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incrementally regenerate the html report of an *.rview file.")
+    parser.add_argument("path", help="the *.rview file")
+    parser.add_argument("output", help="the html shell to write")
+    parser.add_argument("--every", type=float, default=None, help="keep refreshing every this many seconds")
+    args = parser.parse_args()
+
+    while True:
+        try:
+            appended = refresh(args.path, args.output)
+            print(f"> {args.path}: appended {appended} rows")
+        except (EOFError, pickle.UnpicklingError) as e:
+            if args.every is None:
+                raise
+
+            # read while the recorder was rewriting it, the next cycle will see the complete file
+            print(f"> {args.path}: incomplete ({type(e).__name__}), retrying in {args.every}s")
+
+        if args.every is None:
+            break
+
+        time.sleep(args.every)
@@ -0,0 +1,80 @@
+from typing import Iterable
+
+import numpy as np
+
+from analysis.events import histogram
+from analysis.portfolio import Trades, daily, drawdown, equity_curve, from_results, summary
+from strategies.strategy import StrategyResults
+from _utils.typing import PathLike
+from _utils.val import defval_instance, val_instance
+
+from bokeh.layouts import column, gridplot
+from bokeh.models import Div, LayoutDOM
+from bokeh.plotting import figure, output_file, save, show
+
+
+def _summary_table(figures: dict) -> Div:
+    rows = ''.join(f"<tr><td>{name}</td><td style='text-align:right'>{value:,.4g}</td></tr>" if isinstance(value, float) else
+                   f"<tr><td>{name}</td><td style='text-align:right'>{value}</td></tr>" for name, value in figures.items())
+
+    return Div(text=f"<table style='font-family:monospace'>{rows}</table>")
+
+
+def build_report(trades: Trades) -> LayoutDOM:
+    """
+    Builds the portfolio summary page.
+
+    Args:
+        trades (Trades): The trades.
+
+    Returns:
+        LayoutDOM: Summary table, equity curve, drawdown, daily P&L and holding time distribution.
+    """
+    val_instance(trades, Trades)
+
+    tools = "pan,box_zoom,wheel_zoom,reset,save"
+    date, bps = daily(trades)
+    date = date.astype("datetime64[ns]")
+    equity = equity_curve(bps)
+
+    equity_plot = figure(x_axis_type="datetime", title="Equity (bps)", tools=tools)
+    equity_plot.line(date, equity, color='#3063f0')
+
+    drawdown_plot = figure(x_axis_type="datetime", x_range=equity_plot.x_range, title="Drawdown (bps)", tools=tools)
+    drawdown_plot.varea(x=date, y1=drawdown(equity), y2=0, color='#f43546', alpha=0.5)
+
+    daily_plot = figure(x_axis_type="datetime", x_range=equity_plot.x_range, title="Daily P&L (bps)", tools=tools)
+    daily_plot.vbar(x=date, top=bps, width=86_400_000 * 0.8, color=np.where(bps >= 0, '#398e3b', '#f43546').tolist())
+
+    holding = histogram(trades.holding[trades.traded] / 60, bins=30)
+    holding_plot = figure(title="Holding time (min)", tools=tools)
+    holding_plot.quad(left=holding["from"], right=holding["to"], top=holding["count"], bottom=0, color='#ff6d00', alpha=0.7)
+
+    for plot in (equity_plot, drawdown_plot, daily_plot, holding_plot):
+        plot.grid.grid_line_alpha = 0.3
+
+    grid = gridplot([[equity_plot, drawdown_plot], [daily_plot, holding_plot]], sizing_mode="stretch_both")
+
+    return column(_summary_table(summary(trades)), grid, sizing_mode="stretch_both")
+
+
+def report(results: Iterable[StrategyResults | list[StrategyResults]], output: PathLike, open_browser: bool = None) -> None:
+    """
+    Renders the portfolio summary of many days of results to an html file and opens it.
+
+    Args:
+        results (Iterable[StrategyResults | list[StrategyResults]]): Results, or lists of results as stored in *.rview files.
+        output (PathLike): Path of the html file to write.
+        open_browser (bool, optional): Open the html file once written. Defaults to True.
+    """
+    val_instance(output, PathLike)
+    open_browser = defval_instance(open_browser, bool, True)
+
+    layout = build_report(from_results(results))
+
+    output_file(output)
+
+    if open_browser:
+        show(layout)
+    else:
+        save(layout)
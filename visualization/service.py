@@ -0,0 +1,282 @@
+"""
+Local render service for *.rview charts.
+
+GET /view/{date}?start=&end=&interpolate=   renders {root}/{date}.rview to html
+GET /metrics/latency                         render latency summary
+GET /metrics/queue                           worker and queue state
+
+Renders run in a bounded process pool. Concurrent identical requests share a single render, and requests
+beyond the configured queue depth are rejected with 503 instead of piling up.
+
+Usage: python -m visualization.service <root> [--port 8050] [--workers 2] [--max-queue 8]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from _utils.time import TimeRange
+from _utils.typing import PathLike
+from _utils.val import defval_instance, val_instance
+from visualization.view import render
+
+DATE_PATTERN = re.compile(r"^/view/(\d{4}-\d{2}-\d{2})$")
+CHUNK_SIZE = 64 * 1024
+
+TRUE_VALUES = ("1", "true", "yes", "on")
+FALSE_VALUES = ("", "0", "false", "no", "off")
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class QueueFullException(Exception):
+    """Raised when the render queue is at capacity."""
+    pass
+
+
+def _render(path: str, start: str | None, end: str | None, interpolate: bool) -> bytes:
+    # runs in a worker process
+    window = None if start is None and end is None else TimeRange(start, end)
+
+    return render(path, interpolate=interpolate, window=window).encode("utf-8")
+
+
+class RenderService:
+    """
+    Asynchronous HTTP service rendering *.rview files on demand.
+    """
+
+    def __init__(self, root: PathLike, host: str = None, port: int = None, workers: int = None, max_queue: int = None, latency_window: int = None) -> None:
+        """
+        Args:
+            root (PathLike): Directory holding the *.rview files.
+            host (str, optional): Interface to bind to. Defaults to "127.0.0.1".
+            port (int, optional): Port to bind to. Defaults to 8050.
+            workers (int, optional): Number of render processes. Defaults to 2.
+            max_queue (int, optional): Renders allowed to wait for a free worker before requests are rejected. Defaults to 8.
+            latency_window (int, optional): Number of recent renders the latency metrics are computed over. Defaults to 1024.
+        """
+        val_instance(root, PathLike)
+
+        self.root = Path(root)
+        self.host = defval_instance(host, str, "127.0.0.1")
+        self.port = defval_instance(port, int, 8050)
+        self.workers = defval_instance(workers, int, 2)
+        self.max_queue = defval_instance(max_queue, int, 8)
+
+        self._pool: ProcessPoolExecutor = None
+        self._slots: asyncio.Semaphore = None
+        self._renders: dict[tuple, asyncio.Future] = {}
+        self._waiting = 0
+        self._running = 0
+        self._latencies = deque(maxlen=defval_instance(latency_window, int, 1024))
+        self._counters = {"requests": 0, "renders": 0, "coalesced": 0, "rejected": 0, "errors": 0}
+
+    async def render(self, path: Path, start: str | None, end: str | None, interpolate: bool) -> bytes:
+        """
+        Renders a file, sharing the result with any identical render already in flight.
+
+        Raises:
+            QueueFullException: If the render would exceed the queue depth.
+
+        Returns:
+            bytes: The html document.
+        """
+
+        key = (str(path), start, end, interpolate)
+        task = self._renders.get(key)
+
+        if task is not None:
+            self._counters["coalesced"] += 1
+        else:
+            # renders waiting for a slot count from here, not from when their task first runs, so a burst can't overshoot
+            if self._waiting + self._running >= self.workers + self.max_queue:
+                self._counters["rejected"] += 1
+                raise QueueFullException(f"{max(self._waiting + self._running - self.workers, 0)} renders are already queued.")
+
+            self._waiting += 1
+            task = asyncio.ensure_future(self._run(key))
+            self._renders[key] = task
+            task.add_done_callback(lambda _: self._renders.pop(key, None))
+
+        # shielded so a client hanging up doesn't cancel the render for everyone else waiting on it
+        return await asyncio.shield(task)
+
+    async def _run(self, key: tuple) -> bytes:
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._running += 1
+        try:
+            started = time.perf_counter()
+            html = await asyncio.get_running_loop().run_in_executor(self._pool, _render, *key)
+
+            self._latencies.append(time.perf_counter() - started)
+            self._counters["renders"] += 1
+
+            return html
+        except Exception:
+            self._counters["errors"] += 1
+            raise
+        finally:
+            self._running -= 1
+            self._slots.release()
+
+    def latency_metrics(self) -> dict:
+        latencies = np.array(self._latencies) * 1000
+
+        if len(latencies) == 0:
+            return {"count": 0}
+
+        p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+
+        return {"count": len(latencies), "mean_ms": latencies.mean(), "p50_ms": p50, "p90_ms": p90, "p99_ms": p99, "max_ms": latencies.max()}
+
+    def queue_metrics(self) -> dict:
+        return {
+            "workers": self.workers,
+            "running": self._running,
+            "waiting": self._waiting,
+            "max_queue": self.max_queue,
+            "in_flight": len(self._renders),
+            **self._counters,
+        }
+
+    async def _route(self, method: str, target: str) -> tuple[int, str, bytes]:
+        if method != "GET":
+            return 405, "text/plain", b"only GET is supported"
+
+        url = urlsplit(target)
+
+        if url.path == "/metrics/latency":
+            return 200, "application/json", json.dumps(self.latency_metrics()).encode()
+        elif url.path == "/metrics/queue":
+            return 200, "application/json", json.dumps(self.queue_metrics()).encode()
+
+        match = DATE_PATTERN.match(url.path)
+        if match is None:
+            return 404, "text/plain", b"not found"
+
+        path = self.root / f"{match.group(1)}.rview"
+        if not path.is_file():
+            return 404, "text/plain", f"no data for {match.group(1)}".encode()
+
+        query = {k: v[-1] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+
+        interpolate = query.get("interpolate", "").lower()
+        if interpolate not in TRUE_VALUES + FALSE_VALUES:
+            return 400, "text/plain", b"'interpolate' must be a boolean"
+
+        start, end = query.get("start") or None, query.get("end") or None
+        if start is not None or end is not None:
+            try:
+                window = TimeRange(start, end)
+            except (TypeError, ValueError) as e:
+                return 400, "text/plain", str(e).encode()
+
+            # normalized so '9:30' and '09:30:00' share a render
+            start, end = window.start.isoformat(), window.end.isoformat()
+
+        try:
+            html = await self.render(path, start, end, interpolate in TRUE_VALUES)
+        except QueueFullException as e:
+            return 503, "text/plain", str(e).encode()
+
+        return 200, "text/html; charset=utf-8", html
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._counters["requests"] += 1
+
+        try:
+            request_line = (await reader.readline()).decode("latin-1")
+
+            # headers are not needed, just consumed
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            try:
+                method, target, _ = request_line.split(" ", 2)
+            except ValueError:
+                status, content_type, body = 400, "text/plain", b"malformed request"
+            else:
+                try:
+                    status, content_type, body = await self._route(method, target)
+                except Exception as e:
+                    status, content_type, body = 500, "text/plain", f"{type(e).__name__}: {e}".encode()
+
+            head = [
+                f"HTTP/1.1 {status} {REASONS[status]}",
+                f"Content-Type: {content_type}",
+                f"Content-Length: {len(body)}",
+                "Connection: close",
+            ]
+            if status == 503:
+                head.append("Retry-After: 1")
+
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+
+            for i in range(0, len(body), CHUNK_SIZE):
+                writer.write(body[i:i + CHUNK_SIZE])
+                await writer.drain()
+
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self) -> None:
+        """
+        Serves requests until cancelled.
+        """
+
+        # not forked: workers started lazily after start_server would inherit the listening socket and open connections
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        self._slots = asyncio.Semaphore(self.workers)
+
+        server = await asyncio.start_server(self._handle, self.host, self.port)
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self._pool.shutdown(cancel_futures=True)
+
+
+def serve(root: PathLike, **kwargs) -> None:
+    """
+    Runs a RenderService until interrupted.
+
+    Args:
+        root (PathLike): Directory holding the *.rview files.
+
+        The keyword arguments are passed to RenderService.
+    """
+
+    asyncio.run(RenderService(root, **kwargs).serve())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local render service for *.rview charts.")
+    parser.add_argument("root", help="directory holding the *.rview files")
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-queue", type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        serve(args.root, host=args.host, port=args.port, workers=args.workers, max_queue=args.max_queue)
+    except KeyboardInterrupt:
+        pass
@@ -1,146 +1,416 @@
-from pathlib import Path
+import warnings
 
 import numpy as np
 from _utils.typing import PathLike
-
-import pickle
+from _utils.time import TimeRange
 
 from strategies.strategy import StrategyEvent, StrategyResults
+from ticks.integrity import check, read_metadata, report_problems, sort_order
+from ticks.resample import Bars, asof, ffill, freq_ns, ohlc
+from ticks.rview import load, wall_ns
+from ticks.schema import LEGACY_NAMES, TickFrame
+from ticks.window import session_window, window_slices
 from _utils.val import defval_instance, val_instance
 
-import pandas as pd
 import datetime as dt
 
-from bokeh.plotting import output_file
+from bokeh.plotting import output_file, save
+from bokeh.embed import file_html
+from bokeh.resources import CDN
 
-from bokeh.layouts import gridplot
+from bokeh.layouts import column, gridplot, row
 from bokeh.plotting import figure, show
-from bokeh.models import LinearAxis, Range1d, Label, HoverTool, Span
+from bokeh.models import ColumnDataSource, LabelSet, LinearAxis, Range1d, Span, LayoutDOM
+from bokeh.palettes import Category10, Turbo256
 
-def view(path: PathLike, output: PathLike, interpolate: bool = None) -> None:
-    val_instance(path, PathLike)
-    val_instance(output, PathLike)
-    interpolate = defval_instance(interpolate, bool, False)
-    
-    with open(path, "rb") as f:
-        _data = pickle.load(f)
-        
-    data, events, results = _data
-    results: StrategyResults
-    output_file(output)
+from analysis.leadlag import cross_correlation, returns, rolling_beta, rolling_corr
+from visualization.crosshair import add_crosshair
+
+BAR_STYLES = ("candle", "ohlc")
+SERIES_MODES = ("pair", "axes", "bps")
+
+LEADLAG_WINDOW = 60
+LEADLAG_MAX_LAG = dt.timedelta(minutes=5)
+
+# label, line color and line alpha of every event drawn on the chart
+EVENT_STYLES: dict[str, tuple[str, str, float]] = {
+    "stock cliff": ("CLIFF", '#f43546', 0.5),
+    "stock cliff corrected": ("CLIFF C", '#398e3b', 0.5),
+    "verification done": ("VDONE", '#398e3b', 0.5),
+    "verification part 1": ("VP1", '#398e3b', 0.5),
+    "verification reset": ("VRESET", '#f43546', 0.8),
+    "signal 1": ("SIGNAL 1", '#2c60ff', 0.8),
+    "signal 2": ("SIGNAL 2", '#f43546', 0.5),
+}
+
+def event_marks(events: list[StrategyEvent], window: TimeRange = None) -> tuple[dict, dict]:
+    """
+    Returns the vertical lines and labels of the events as source columns, sorted by time.
+
+    Args:
+        events (list[StrategyEvent]): Events.
+        window (TimeRange, optional): Only keep the events within this window of the day. Defaults to all events.
+
+    Returns:
+        tuple[dict, dict]: Lines (TIME, NAME, COLOR, ALPHA) and labels (TIME, TEXT, Y in screen units), TIME being
+        datetime64[ns] naive wall clock times.
+    """
     
-    df: pd.DataFrame = pd.DataFrame(data, columns=["TIME", "INDEX", "STOCK"])
-    df = df.sort_values("TIME")
-    df = df.reset_index(drop=True)
+    events = [event for event in events if event.name in EVENT_STYLES]
+    time = wall_ns([event.time for event in events]) if len(events) else np.array([], dtype="int64")
     
-    # if df["TIME"].dtype == object:
-    def localize(x: dt.datetime) -> None:
-        return x.replace(tzinfo=None)
-        
-    df["TIME"] = df["TIME"].apply(localize)
-    df["TIME"] = df["TIME"].astype(np.datetime64)
+    order = np.argsort(time, kind="stable")
+    if window is not None:
+        order = order[window.contains_many(time[order])]
     
-    def just_time(datetime: dt.datetime) -> dt.time:
-        return datetime.time()
+    events, time = [events[i] for i in order], time[order].astype("datetime64[ns]")
     
-    df["_time"] = df["TIME"].apply(just_time)
+    marks = {"TIME": time, "NAME": [event.name for event in events], "COLOR": [EVENT_STYLES[event.name][1] for event in events], "ALPHA": [EVENT_STYLES[event.name][2] for event in events]}
+    labels = {"TIME": [], "TEXT": [], "Y": []}
     
-    plot = figure(x_axis_type="datetime", title=f"Graph", tools = "freehand_draw,poly_draw,poly_edit,pan,box_zoom,wheel_zoom,undo,redo,reset,save")
-    sell_time: dt.datetime = None
-    
-    for event in events:
-        event: StrategyEvent
-        
-        event_time, event_name, event_value = event
-        
-        event_time = localize(event_time)
-        
-        labels: list[Label] = []
-        vlines: list[Span] = []
+    for t, (event_time, event_name, event_value) in zip(time, events):
+        text = EVENT_STYLES[event_name][0]
         
-        if event_name == "stock cliff":
-            vlines.append(Span(location=event_time, dimension='height', line_color='#f43546', line_width=3, line_alpha=0.5))
-            labels.append(Label(x=(event_time), y=(20), y_units='screen', text=' CLIFF', text_font_style="bold"))
-        elif event_name == "stock cliff corrected":
-            vlines.append(Span(location=event_time, dimension='height', line_color='#398e3b', line_width=3, line_alpha=0.5))
-            labels.append(Label(x=(event_time), y=(20), y_units='screen', text=' CLIFF C', text_font_style="bold"))
-        elif event_name == "verification done":
-            vlines.append(Span(location=event_time, dimension='height', line_color='#398e3b', line_width=3, line_alpha=0.5))
-            labels.append(Label(x=(event_time), y=(20), y_units='screen', text=' VDONE', text_font_style="bold"))
-        elif event_name == "verification part 1":
-            vlines.append(Span(location=event_time, dimension='height', line_color='#398e3b', line_width=3, line_alpha=0.5))
-            labels.append(Label(x=(event_time), y=(20), y_units='screen', text=' VP1', text_font_style="bold"))
-        elif event_name == "verification reset":
-            vlines.append(Span(location=event_time, dimension='height', line_color='#f43546', line_width=3, line_alpha=0.8))
-            labels.append(Label(x=(event_time), y=(20), y_units='screen', text=' VRESET', text_font_style="bold"))
-        elif event_name == "signal 1":
-            labels.append(Label(x=(event_time), y=(100), y_units='screen', text=' SIGNAL 1', text_font_style="bold"))
-            # labels.append(Label(x=(event_time), y=(80), y_units='screen', text=f' ${results.buy_price}', text_font_style="bold"))
-            labels.append(Label(x=(event_time), y=(60), y_units='screen', text=f' {event_time.time()}', text_font_style="bold"))
-            vlines.append(Span(location=event_time, dimension='height', line_color='#2c60ff', line_width=3, line_alpha=0.8))
+        if event_name == "signal 1":
+            rows = [(f' {text}', 100), (f' {event_time.replace(tzinfo=None).time()}', 60)]
         elif event_name == "signal 2":
-            labels.append(Label(x=(event_time), y=(100), y_units='screen', text=f' SIGNAL 2 {event_value}', text_font_style="bold"))
-            # labels.append(Label(x=(event_time), y=(80), y_units='screen', text=f' ${results.sell_price}', text_font_style="bold"))
-            labels.append(Label(x=(event_time), y=(60), y_units='screen', text=f' {event_time.time()}', text_font_style="bold"))
-            # labels.append(Label(x=(event_time), y=(40), y_units='screen', text=f'  Δ%: {str(results.pnl_perc() * 100).ljust(5)[:5]}%', text_font_style="bold"))
-            # labels.append(Label(x=(event_time), y=(20), y_units='screen', text=f' P&L: {str(results.pnl_bps()).ljust(5)[:6]}bps', text_font_style="bold"))
-            vlines.append(Span(location=event_time, dimension='height', line_color='#f43546', line_width=3, line_alpha=0.5))
+            rows = [(f' {text} {event_value}', 100), (f' {event_time.replace(tzinfo=None).time()}', 60)]
+        else:
+            rows = [(f' {text}', 20)]
         
-        for label in labels:
-            plot.add_layout(label)
-            
-        for vline in vlines:
-            plot.add_layout(vline)
-            
-    cut_off_time: dt.time = None
-    if sell_time is not None:
-        cut_off_time = (sell_time + dt.timedelta(minutes=2)).time()
+        for label, y in rows:
+            labels["TIME"].append(t)
+            labels["TEXT"].append(label)
+            labels["Y"].append(y)
+    
+    labels["TIME"] = np.array(labels["TIME"], dtype="datetime64[ns]")
+    
+    return marks, labels
+
+
+def plot_events(plot: figure, marks: ColumnDataSource, labels: ColumnDataSource) -> None:
+    """
+    Draws events from event_marks() sources, as full height lines and labels at fixed screen heights.
+
+    Args:
+        plot (figure): Plot to draw on.
+        marks (ColumnDataSource): Lines.
+        labels (ColumnDataSource): Labels.
+    """
+    
+    plot.vspan(x="TIME", source=marks, line_color="COLOR", line_alpha="ALPHA", line_width=3)
+    plot.add_layout(LabelSet(x="TIME", y="Y", y_units='screen', text="TEXT", source=labels, text_font_style="bold"))
+
+
+def _span(values: np.ndarray) -> tuple[float, float]:
+    """
+    Returns the lowest and highest finite values, (0, 1) if there are none so an empty window still renders.
+    """
+
+    values = values[np.isfinite(values)]
+
+    return (float(values.min()), float(values.max())) if len(values) else (0.0, 1.0)
+
+
+def _bar_source(stock: Bars, index: Bars, step: int) -> ColumnDataSource:
+    """
+    Returns a crosshair source of the bar closes, at the bar centers.
+
+    Args:
+        stock (Bars): Stock bars.
+        index (Bars): Index bars.
+        step (int): Bar length in nanoseconds.
+
+    Returns:
+        ColumnDataSource: Source with TIME, INDEX and STOCK columns, one row per bar.
+    """
+
+    # either instrument may have empty bins the other doesn't
+    time = np.union1d(stock.time, index.time)
+
+    return ColumnDataSource(data={
+        "TIME": time + np.timedelta64(step // 2, "ns"),
+        "INDEX": asof(time, index.time, index.close),
+        "STOCK": asof(time, stock.time, stock.close),
+    })
+
+
+def _leadlag_panel(plot: figure, time: np.ndarray, index: np.ndarray, stock: np.ndarray, freq: str) -> LayoutDOM:
+    """
+    Builds the lead-lag panel: rolling correlation and beta of stock on index returns, and their cross-correlation profile.
+
+    Args:
+        plot (figure): Main plot, its x range is shared with the rolling panel.
+        time (np.ndarray): Tick times.
+        index (np.ndarray): Index prices.
+        stock (np.ndarray): Stock prices.
+        freq (str): Frequency the returns are computed at.
+
+    Returns:
+        LayoutDOM: The panel.
+    """
+    
+    grid, _returns = returns(time, np.column_stack([index, stock]), freq)
+    index_returns, stock_returns = _returns[:, 0], _returns[:, 1]
+    
+    rolling = figure(x_axis_type="datetime", x_range=plot.x_range, title=f"Rolling {LEADLAG_WINDOW} x {freq} correlation and beta", height=250, sizing_mode="stretch_width", tools="pan,box_zoom,wheel_zoom,reset,save")
+    rolling.line(grid, rolling_corr(index_returns, stock_returns, LEADLAG_WINDOW), color='#2c60ff', legend_label='Correlation')
+    rolling.line(grid, rolling_beta(index_returns, stock_returns, LEADLAG_WINDOW), color='#398e3b', legend_label='Beta')
+    rolling.legend.location = "top_left"
+    
+    max_lag = int(LEADLAG_MAX_LAG / dt.timedelta(microseconds=1) * 1_000) // freq_ns(freq)
+    lags, corr = cross_correlation(index_returns, stock_returns, max_lag)
+    seconds = lags * freq_ns(freq) / 1e9
+    
+    profile = figure(title=f"Cross-correlation of {freq} returns (positive lag: index leads)", height=250, sizing_mode="stretch_width", tools="pan,box_zoom,wheel_zoom,reset,save")
+    profile.vbar(x=seconds, top=corr, width=freq_ns(freq) / 1e9 * 0.8, color='#ff6d00')
+    profile.add_layout(Span(location=0, dimension='height', line_color='#555555', line_dash='dotted'))
+    profile.xaxis.axis_label = 'Lag (s)'
+    
+    return row(rolling, profile, sizing_mode="stretch_width")
+
+def _plot_bars(plot: figure, bars: Bars, step: int, color: str, legend_label: str, bar_style: str, y_range_name: str = "default") -> None:
+    """
+    Draws OHLC bars on the plot.
+
+    Args:
+        plot (figure): Plot to draw on.
+        bars (Bars): Bars to draw.
+        step (int): Bar length in nanoseconds.
+        color (str): Bar colour.
+        legend_label (str): Legend entry.
+        bar_style (str): "candle" for candlesticks, "ohlc" for open/close ticked bars.
+        y_range_name (str, optional): Y range to draw against. Defaults to "default".
+    """
+    
+    center = bars.time + np.timedelta64(step // 2, "ns")
+    width = step / 1_000_000 * 0.7 # datetime axes are in milliseconds
+    
+    plot.segment(x0=center, y0=bars.high, x1=center, y1=bars.low, color=color, y_range_name=y_range_name)
+    
+    if bar_style == "candle":
+        up = bars.close >= bars.open
+        plot.vbar(x=center, width=width, top=np.maximum(bars.open, bars.close), bottom=np.minimum(bars.open, bars.close),
+                  fill_color=np.where(up, color, "white").tolist(), line_color=color, legend_label=legend_label, y_range_name=y_range_name)
     else:
-        cut_off_time = dt.time(9, 50, 0)
+        tick = np.timedelta64(int(width * 1_000_000 / 2), "ns")
+        plot.segment(x0=center - tick, y0=bars.open, x1=center, y1=bars.open, color=color, legend_label=legend_label, y_range_name=y_range_name)
+        plot.segment(x0=center, y0=bars.close, x1=center + tick, y1=bars.close, color=color, y_range_name=y_range_name)
+
+def _palette(n: int) -> list[str]:
+    if n <= 10:
+        return list(Category10[10][:n])
     
-    mask = (df["_time"] > dt.time(9, 25, 0)) & (df["_time"] < cut_off_time)
-    df = df.loc[mask]
+    return [Turbo256[i] for i in np.linspace(0, 255, n).astype(int)]
+
+def _plot_series(plot: figure, frame: TickFrame, mode: str) -> None:
+    """
+    Draws every instrument of the frame, either on its own y axis ("axes") or normalized to bps from its first price on a shared axis ("bps").
+
+    Args:
+        plot (figure): Plot to draw on.
+        frame (TickFrame): Ticks to draw.
+        mode (str): "axes" or "bps".
+    """
     
-    # df["TIME"] = df["TIME"].apply(to_datetime)
-    df["TIME"] = df["TIME"].dt.tz_localize(None)
+    values = frame.values
+    
+    if mode == "bps" and len(values):
+        first = np.argmax(~np.isnan(values), axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = (values / values[first, np.arange(values.shape[1])] - 1) * 10_000
+    
+    # ranges of every series in one vectorized pass
+    if len(values) == 0:
+        lows, highs = np.zeros(values.shape[1]), np.ones(values.shape[1])
+    else:
+        with np.errstate(invalid="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning) # all NaN columns
+            lows, highs = np.nanmin(values, axis=0), np.nanmax(values, axis=0)
     
+    source = ColumnDataSource(data={"TIME": frame.time.astype("datetime64[ns]"), **{name: values[:, i] for i, name in enumerate(frame.names)}})
+    colors = _palette(len(frame.names))
+    
+    if mode == "bps":
+        plot.y_range = Range1d(start=np.nanmin(lows), end=np.nanmax(highs))
+        plot.yaxis.axis_label = 'bps from open'
+    else:
+        plot.y_range = Range1d(start=lows[0], end=highs[0])
+        plot.yaxis.axis_label = frame.names[0]
+        plot.extra_y_ranges = {name: Range1d(start=lows[i], end=highs[i]) for i, name in enumerate(frame.names) if i > 0}
+        
+        for i, name in enumerate(frame.names[1:], start=1):
+            plot.add_layout(LinearAxis(y_range_name=name, axis_label=name, axis_line_color=colors[i], major_label_text_color=colors[i]), 'right')
+    
+    for i, name in enumerate(frame.names):
+        y_range_name = "default" if mode == "bps" or i == 0 else name
+        plot.line("TIME", name, source=source, color=colors[i], legend_label=name, y_range_name=y_range_name)
+    
+    plot.legend.click_policy = "hide"
+
+def build(path: PathLike, interpolate: bool = None, bars: str = None, bar_style: str = None, window: TimeRange = None, padding: dt.timedelta = None, crosshair: bool = None, leadlag: str = None, strict: bool = None, names: list[str] = None, series: str = None) -> LayoutDOM:
+    """
+    Builds the chart of the ticks and events of an *.rview file.
+
+    Args:
+        path (PathLike): Path to the *.rview file.
+        interpolate (bool, optional): Forward fill missing prices. Defaults to False.
+        bars (str, optional): Aggregate ticks into bars of this length ("1s", "5s", "1m") instead of drawing raw ticks. Defaults to None.
+        bar_style (str, optional): "candle" or "ohlc". Defaults to "candle".
+        window (TimeRange, optional): Time of day to show. Defaults to the session window derived from the file's results.
+        padding (dt.timedelta, optional): Time shown around the trades in the session window. Defaults to 2 minutes.
+        crosshair (bool, optional): Add a crosshair showing the exact tick (or bar close, with bars) and nearest event under the cursor. Defaults to True.
+        leadlag (str, optional): Add a lead-lag panel computed on returns at this frequency ("1s", "5s", "1m"). Defaults to None.
+        strict (bool, optional): Raise IntegrityException instead of warning when the ticks have integrity problems. Defaults to False.
+        names (list[str], optional): Instrument names of legacy [time, price, ...] rows. Defaults to ["INDEX", "STOCK"].
+        series (str, optional): "pair" draws STOCK and INDEX on twin axes, "axes" gives every instrument its own axis and "bps"
+            normalizes every instrument to bps from its first price. Bars, the crosshair and the lead-lag panel need "pair".
+            Defaults to "pair" for INDEX/STOCK files and "bps" otherwise.
+
+    Returns:
+        LayoutDOM: The chart.
+    """
+    val_instance(path, PathLike)
+    interpolate = defval_instance(interpolate, bool, False)
+    bars = defval_instance(bars, str, None)
+    bar_style = defval_instance(bar_style, str, "candle")
+    window = defval_instance(window, TimeRange, None)
+    padding = defval_instance(padding, dt.timedelta, None)
+    crosshair = defval_instance(crosshair, bool, True)
+    leadlag = defval_instance(leadlag, str, None)
+    strict = defval_instance(strict, bool, False)
+    names = defval_instance(names, list, None)
+    series = defval_instance(series, str, None)
+    
+    if bar_style not in BAR_STYLES:
+        raise ValueError(f"Expected one of {', '.join(BAR_STYLES)} for 'bar_style', got '{bar_style}'.")
+    
+    data, events, results = load(path)
+    results: list[StrategyResults]
+    
+    frame = TickFrame.from_data(data, names)
+    
+    if series is None:
+        series = "pair" if sorted(frame.names) == sorted(LEGACY_NAMES) else "bps"
+    
+    if series not in SERIES_MODES:
+        raise ValueError(f"Expected one of {', '.join(SERIES_MODES)} for 'series', got '{series}'.")
+    
+    if series == "pair" and not set(LEGACY_NAMES) <= set(frame.names):
+        raise ValueError(f"series='pair' needs INDEX and STOCK instruments, got {', '.join(frame.names)}.")
+    
+    if series != "pair" and (bars is not None or leadlag is not None):
+        raise ValueError(f"'bars' and 'leadlag' need series='pair', got '{series}'.")
+    
+    # recorded ticks are almost always in order, the integrity metadata (or an O(n) check) says whether sorting can be skipped
+    report = read_metadata(path)
+    if report is None:
+        report = check(frame.time, frame.columns(), frame.offsets)
+    
+    report_problems(report, str(path), strict)
+    
+    order = sort_order(frame.time, report)
+    time_ns = frame.time if order is None else frame.time[order]
+    
+    if window is None:
+        window = session_window(results, padding)
+    
+    # the ticks are sorted, so the window is found by binary search instead of masking every row
+    rows = np.concatenate([np.arange(s.start, s.stop) for s in window_slices(time_ns, window)] or [np.array([], dtype=int)])
+    
+    frame = frame.take(rows if order is None else order[rows])
+    
+    plot = figure(x_axis_type="datetime", title=f"Graph", tools = "freehand_draw,poly_draw,poly_edit,pan,box_zoom,wheel_zoom,undo,redo,reset,save")
+    
+    marks, labels = event_marks(events, window)
+    marks, labels = ColumnDataSource(data=marks), ColumnDataSource(data=labels)
+    
+    plot_events(plot, marks, labels)
+            
     if interpolate:
-        df = df.interpolate(method="ffill")
+        frame.values = ffill(frame.values)
     
-    time = df["TIME"].tolist()
-    index = df["INDEX"].tolist()
-    stock = df["STOCK"].tolist()
+    plot.grid.grid_line_alpha=0.3
+    plot.xaxis.axis_label = 'Time'
+    
+    if series != "pair":
+        _plot_series(plot, frame, series)
+        plot.legend.location = "top_left"
+        
+        return gridplot([[plot]], sizing_mode="stretch_both")
     
-    stock_range = (np.nanmin(stock), np.nanmax(stock))
-    index_range = (np.nanmin(index), np.nanmax(index))
+    ticks = ColumnDataSource(data={"TIME": frame.time.astype("datetime64[ns]"), "INDEX": frame.column("INDEX"), "STOCK": frame.column("STOCK")})
+    
+    stock_range = _span(ticks.data["STOCK"])
+    index_range = _span(ticks.data["INDEX"])
     
     plot.y_range = Range1d(start=stock_range[0], end=stock_range[1])
     plot.extra_y_ranges = {"index_range": Range1d(start=index_range[0], end=index_range[1])}
     
     plot.add_layout(LinearAxis(y_range_name="index_range"), 'right')
-    plot.grid.grid_line_alpha=0.3
-    plot.xaxis.axis_label = 'Time'
     plot.yaxis.axis_label = 'Price'
     
-    plot.line(time, stock, color='#3063f0', legend_label='Stock')
-    plot.line(time, index, color='#ff6d00', legend_label='Index', y_range_name="index_range")
+    if bars is None:
+        plot.line("TIME", "STOCK", source=ticks, color='#3063f0', legend_label='Stock')
+        plot.line("TIME", "INDEX", source=ticks, color='#ff6d00', legend_label='Index', y_range_name="index_range")
+        
+        crosshair_source = ticks
+    else:
+        step = freq_ns(bars)
+        stock_bars, index_bars = ohlc(frame.time, ticks.data["STOCK"], bars), ohlc(frame.time, ticks.data["INDEX"], bars)
+        
+        _plot_bars(plot, stock_bars, step, '#3063f0', 'Stock', bar_style)
+        _plot_bars(plot, index_bars, step, '#ff6d00', 'Index', bar_style, y_range_name="index_range")
+        
+        # the raw ticks would be embedded just for the crosshair, the bars are all it can point at anyway
+        crosshair_source = _bar_source(stock_bars, index_bars, step) if crosshair else None
     
     plot.legend.location = "top_left"
             
-    hover_tools = HoverTool(
-        tooltips=[
-            ( 'Time',  '@x{%F %H:%M:%S}'),
-            ( 'Price',  '$@y{%0.2f}' ), # use @{ } for field names with spaces
-        ],
-        formatters={
-            '@x' : 'datetime', # use 'datetime' formatter for '@date' field
-            '@y' : 'printf',   # use 'printf' formatter for '@{adj close}' field
-                                            # use default 'numeral' formatter for other fields
-        },
-        # display a tooltip whenever the cursor is vertically in line with a glyph
-        mode='vline'
-    )
-    
-    # plot.add_tools(hover_tools)
-    
-    show(gridplot([[plot]], sizing_mode="stretch_both"))
\ No newline at end of file
+    if crosshair:
+        add_crosshair(plot, crosshair_source, marks, "index_range")
+    
+    if leadlag is not None:
+        panel = _leadlag_panel(plot, ticks.data["TIME"], ticks.data["INDEX"], ticks.data["STOCK"], leadlag)
+        
+        return column(gridplot([[plot]], sizing_mode="stretch_both"), panel, sizing_mode="stretch_both")
+    
+    return gridplot([[plot]], sizing_mode="stretch_both")
+
+def view(path: PathLike, output: PathLike, interpolate: bool = None, bars: str = None, bar_style: str = None, window: TimeRange = None, padding: dt.timedelta = None, crosshair: bool = None, leadlag: str = None, strict: bool = None, names: list[str] = None, series: str = None, open_browser: bool = None) -> None:
+    """
+    Renders the ticks and events of an *.rview file to an html file and opens it.
+
+    Args:
+        path (PathLike): Path to the *.rview file.
+        output (PathLike): Path of the html file to write.
+        open_browser (bool, optional): Open the html file once written. Defaults to True.
+        
+        The remaining arguments are passed to build().
+    """
+    val_instance(output, PathLike)
+    open_browser = defval_instance(open_browser, bool, True)
+    
+    layout = build(path, interpolate=interpolate, bars=bars, bar_style=bar_style, window=window, padding=padding, crosshair=crosshair, leadlag=leadlag, strict=strict, names=names, series=series)
+    
+    output_file(output)
+    
+    if open_browser:
+        show(layout)
+    else:
+        save(layout)
+
+def render(path: PathLike, **kwargs) -> str:
+    """
+    Renders the ticks and events of an *.rview file to a standalone html document.
+
+    Args:
+        path (PathLike): Path to the *.rview file.
+        
+        The keyword arguments are passed to build().
+
+    Returns:
+        str: The html document.
+    """
+    
+    return file_html(build(path, **kwargs), CDN, "Graph")
\ No newline at end of file